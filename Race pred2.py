@@ -1,9 +1,19 @@
-import pandas as pd
 import numpy as np
 import time
 import sys
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import csv
+import json
+import shutil
+import heapq
+import itertools
+import functools
+import threading
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
 import warnings
 from dotenv import load_dotenv
@@ -11,10 +21,100 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-class WeatherIntegration:
+WEATHER_TTL = 300  # seconds before cached track weather is refreshed in the background
+DASHBOARD_REFRESH = 2.0  # seconds between live dashboard updates
+REPLAY_SPEED = 10.0  # session seconds replayed per wall-clock second
+SESSION_STORE_DIR = './session_store'  # memory-mapped copies of loaded sessions
+
+# Strategy simulation
+DRY_COMPOUNDS = ['SOFT', 'MEDIUM', 'HARD']
+STRATEGY_SIMULATIONS = 20000  # Monte Carlo races per finalist strategy
+SCREEN_SIMULATIONS = 1000     # races per candidate when narrowing the field
+STRATEGY_FINALISTS = 12       # candidates re-run at full STRATEGY_SIMULATIONS
+STRATEGY_WORKERS = 1          # >1 spreads simulations over that many processes
+PIT_LOSS = 22.0               # seconds lost to a green-flag stop
+SC_PIT_LOSS = 11.0            # seconds lost to a stop under the safety car
+SAFETY_CAR_LAP_PROB = 0.01    # chance of a safety car being deployed on a given lap
+SAFETY_CAR_LAPS = 4           # laps a safety car stays out
+RAIN_SWITCH_WINDOW = 3        # laps after rain starts in which a planned stop doubles as the switch
+MIN_STINT = 8
+PIT_LAP_STEP = 2              # granularity of candidate pit laps
+DEFAULT_RACE_LAPS = 57
+DEG_TEMP_REFERENCE = 35.0     # track temperature (°C) the fitted degradation is scaled from
+FUEL_EFFECT = 0.055           # seconds per lap of fuel still on board
+MIN_FIT_LAPS = 4              # clean laps a stint needs before its degradation is trusted
+# pandas is imported inside the session methods that need it (FastF1 pulls it in anyway)
+# so that starting up and reaching the menu doesn't pay for it
+
+class PerformanceMonitor:
+    """Named timers and counters behind the Performance screen
+    
+    Names are grouped by their prefix: handler.*, timing.*, weather.*, model.*,
+    store.*, external.* and cosmetic.*. Cache counters are named
+    cache.<name>.hit / cache.<name>.miss.
+    """
+    
     def __init__(self):
+        self._lock = threading.Lock()
+        self.timers = {}    # name -> [calls, total seconds, max seconds]
+        self.counters = {}  # name -> count
+    
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self.timers.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+    
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+    
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+    
+    def timed(self, name):
+        """Decorator recording every call of the function under `name`"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def group(self, prefix):
+        """(name, calls, total, max) for timers under `prefix`, slowest total first"""
+        with self._lock:
+            rows = [(name.split('.', 1)[1], *stats) for name, stats in self.timers.items()
+                    if name.startswith(prefix + '.')]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+    
+    def cache_stats(self):
+        """(cache, hits, misses) for every cache that has been consulted"""
+        with self._lock:
+            names = sorted({name.split('.')[1] for name in self.counters if name.startswith('cache.')})
+            return [(name, self.counters.get(f'cache.{name}.hit', 0), self.counters.get(f'cache.{name}.miss', 0))
+                    for name in names]
+    
+    def reset(self):
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+
+perf = PerformanceMonitor()
+
+class WeatherIntegration:
+    def __init__(self, base_url=None, ttl=WEATHER_TTL):
         self.api_key = os.getenv('OPENWEATHER_API_KEY')
-        self.base_url = "http://api.openweathermap.org/data/2.5"
+        # OPENWEATHER_BASE_URL lets tests point this at a local fake server
+        self.base_url = base_url or os.getenv('OPENWEATHER_BASE_URL', "http://api.openweathermap.org/data/2.5")
+        self.ttl = ttl
         self.track_coordinates = {
             'sebring': (27.454, -81.354),
             'daytona': (29.187, -81.071),
@@ -24,38 +124,102 @@ class WeatherIntegration:
             'spa': (50.437, 5.975)
         }
         
-    def get_track_weather(self, track_name="sebring"):
-        """Get real-time weather for track location"""
+        # One keep-alive connection per track so a full refresh runs in parallel
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=len(self.track_coordinates))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.track_coordinates))
+        self._cache = {}       # track -> (fetched_at, weather)
+        self._refreshing = {}  # track -> Future of an in-flight fetch
+        self._lock = threading.Lock()
+        
+    def _fetch_weather(self, track_name):
+        """Fetch one track's weather; returns None on failure"""
+        track_lat, track_lon = self.track_coordinates.get(track_name, self.track_coordinates['sebring'])
+        try:
+            with perf.timer('external.openweather'):
+                response = self.session.get(
+                    f"{self.base_url}/weather",
+                    params={
+                        'lat': track_lat,
+                        'lon': track_lon,
+                        'appid': self.api_key,
+                        'units': 'metric'
+                    },
+                    timeout=10
+                )
+            if response.status_code != 200:
+                return None
+            weather_info = self._parse_weather_data(response.json())
+        except Exception:
+            return None
+        
+        with self._lock:
+            self._cache[track_name] = (time.monotonic(), weather_info)
+        return weather_info
+    
+    def _refresh_in_background(self, track_name):
+        """Start a fetch for the track unless one is already running"""
+        with self._lock:
+            future = self._refreshing.get(track_name)
+            if future is None or future.done():
+                future = self._executor.submit(self._fetch_weather, track_name)
+                self._refreshing[track_name] = future
+            return future
+    
+    def refresh_all(self, block=False):
+        """Refresh every track in parallel; returns immediately unless block=True"""
+        if not self.api_key:
+            return
+        futures = [self._refresh_in_background(track) for track in self.track_coordinates]
+        if block:
+            wait(futures)
+    
+    @perf.timed('weather.get_track_weather')
+    def get_track_weather(self, track_name="sebring", force=False):
+        """Get real-time weather for track location
+        
+        Cached data is returned straight away; once older than the TTL a background
+        refresh is started and the stale copy is served until it completes.
+        """
         if not self.api_key:
             return self.get_fallback_weather()
-            
-        track_lat, track_lon = self.track_coordinates.get(track_name, self.track_coordinates['sebring'])
         
-        try:
-            print(f"🌤️  Fetching live weather for {track_name.upper()}...")
-            response = requests.get(
-                f"{self.base_url}/weather",
-                params={
-                    'lat': track_lat,
-                    'lon': track_lon,
-                    'appid': self.api_key,
-                    'units': 'metric'
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                weather_info = self._parse_weather_data(data)
-                print("✅ Live weather data received!")
-                return weather_info
-            else:
-                print(f"❌ Weather API error: {response.status_code}")
-                return self.get_fallback_weather()
-                
-        except Exception as e:
-            print(f"❌ Weather connection failed: {e}")
+        with self._lock:
+            cached = self._cache.get(track_name)
+        perf.count('cache.weather.hit' if cached and not force else 'cache.weather.miss')
+        if cached and not force:
+            fetched_at, weather_info = cached
+            if time.monotonic() - fetched_at > self.ttl:
+                self._refresh_in_background(track_name)
+            return weather_info
+        
+        print(f"🌤️  Fetching live weather for {track_name.upper()}...")
+        weather_info = self._refresh_in_background(track_name).result()
+        if weather_info:
+            print("✅ Live weather data received!")
+            return weather_info
+        print("❌ Weather fetch failed")
+        return cached[1] if cached else self.get_fallback_weather()
+    
+    def cached_weather(self, track_name="sebring"):
+        """Cached weather for the track without fetching or printing; None if never fetched
+        
+        Safe to call from background threads. A stale entry is returned as is while a
+        background refresh is started, as in get_track_weather.
+        """
+        if not self.api_key:
             return self.get_fallback_weather()
+        with self._lock:
+            cached = self._cache.get(track_name)
+        perf.count('cache.weather.hit' if cached else 'cache.weather.miss')
+        if cached is None:
+            return None
+        fetched_at, weather_info = cached
+        if time.monotonic() - fetched_at > self.ttl:
+            self._refresh_in_background(track_name)
+        return weather_info
     
     def _parse_weather_data(self, data):
         """Parse OpenWeather API response"""
@@ -94,11 +258,170 @@ class WeatherIntegration:
             'last_updated': datetime.now().strftime('%H:%M:%S')
         }
 
+class StoredSession:
+    """The parts of a FastF1 session that LiveTimingIntegration reads, rebuilt from the store"""
+    
+    def __init__(self, laps, results, meta):
+        self.laps = laps
+        self.results = results
+        self.drivers = meta['drivers']
+        self.event = meta['event']
+        self.name = meta['name']
+        self.total_laps = meta.get('total_laps')
+        start = meta.get('session_start_time')
+        self.session_start_time = np.timedelta64(start, 'ns') if start is not None else None
+
+class SessionStore:
+    """Columnar on-disk copies of loaded sessions, one .npy file per lap column
+    
+    index.json maps "year/event/session" to a directory holding the lap columns
+    and a small meta.json (event, drivers, results). Loading memory-maps the
+    columns, so reopening a stored session skips FastF1 entirely.
+    """
+    
+    # column -> storage kind; only columns present in the session's laps are saved
+    LAP_COLUMNS = {
+        'DriverNumber': 'str', 'Driver': 'str', 'Compound': 'str', 'TrackStatus': 'str',
+        'LapNumber': 'float', 'TyreLife': 'float', 'Stint': 'float', 'Position': 'float',
+        'LapTime': 'time', 'Time': 'time', 'LapStartTime': 'time',
+        'Sector1Time': 'time', 'Sector2Time': 'time', 'Sector3Time': 'time',
+        'PitInTime': 'time', 'PitOutTime': 'time',
+    }
+    RESULT_COLUMNS = ['DriverNumber', 'Abbreviation', 'FullName', 'TeamName']
+    
+    def __init__(self, root=SESSION_STORE_DIR, write_index=True):
+        self.root = root
+        # Worker processes save with write_index=False and hand `unindexed` back to the
+        # parent, so only one process ever rewrites index.json
+        self.write_index = write_index
+        self.unindexed = {}
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(root, 'index.json')
+    
+    @staticmethod
+    def key(year, event, session):
+        return f"{year}/{event}/{session}"
+    
+    def _read_index(self):
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def entries(self):
+        """Stored session keys, oldest first"""
+        return list(self._read_index())
+    
+    def __contains__(self, key):
+        return key in self._read_index()
+    
+    def add_entries(self, entries):
+        """Merge {key: entry} into index.json"""
+        with self._lock:
+            index = self._read_index()
+            index.update(entries)
+            with open(self._index_path + '.tmp', 'w') as f:
+                json.dump(index, f, indent=1)
+            os.replace(self._index_path + '.tmp', self._index_path)
+    
+    @perf.timed('store.save')
+    def save(self, year, event, session, f1_session):
+        """Write a loaded session's lap columns and metadata, replacing any earlier copy"""
+        import pandas as pd
+        key = self.key(year, event, session)
+        dirname = "".join(c if c.isalnum() else '_' for c in key.lower())
+        path = os.path.join(self.root, dirname)
+        tmp = path + '.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        
+        laps = f1_session.laps
+        columns = [c for c in self.LAP_COLUMNS if c in laps.columns]
+        for column in columns:
+            kind = self.LAP_COLUMNS[column]
+            if kind == 'time':
+                values = pd.to_timedelta(laps[column]).to_numpy(dtype='timedelta64[ns]')
+            elif kind == 'float':
+                values = laps[column].to_numpy(dtype=np.float64)
+            else:
+                values = laps[column].fillna('').astype(str).to_numpy(dtype=str)
+            np.save(os.path.join(tmp, f'{column}.npy'), values)
+        
+        event_info = f1_session.event
+        start = getattr(f1_session, 'session_start_time', None)
+        total_laps = getattr(f1_session, 'total_laps', None)
+        meta = {
+            'columns': columns,
+            'event': {'EventName': str(event_info['EventName'])},
+            'name': str(f1_session.name),
+            'drivers': [str(d) for d in f1_session.drivers],
+            'total_laps': int(total_laps) if total_laps is not None and pd.notna(total_laps) else None,
+            'session_start_time': int(pd.Timedelta(start).value) if start is not None and pd.notna(start) else None,
+            'results': f1_session.results[self.RESULT_COLUMNS].astype(str).to_dict('list'),
+        }
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        
+        with self._lock:
+            shutil.rmtree(path, ignore_errors=True)
+            os.replace(tmp, path)
+        entry = {'dir': dirname, 'laps': len(laps), 'saved': datetime.now().isoformat(timespec='seconds')}
+        if self.write_index:
+            self.add_entries({key: entry})
+        else:
+            self.unindexed[key] = entry
+    
+    @perf.timed('store.load')
+    def load(self, year, event, session):
+        """Memory-map a stored session; returns a StoredSession, or None if it isn't stored"""
+        entry = self._read_index().get(self.key(year, event, session))
+        if entry is None:
+            return None
+        import pandas as pd
+        path = os.path.join(self.root, entry['dir'])
+        try:
+            with open(os.path.join(path, 'meta.json')) as f:
+                meta = json.load(f)
+            columns = {}
+            for column in meta['columns']:
+                values = np.load(os.path.join(path, f'{column}.npy'), mmap_mode='r')
+                if self.LAP_COLUMNS[column] == 'str':
+                    # Empty strings stand in for missing values on disk
+                    values = pd.Series(values).where(values != '')
+                columns[column] = values
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        laps = pd.DataFrame(columns, copy=False)
+        results = pd.DataFrame(meta['results'])
+        results.index = results['DriverNumber'].to_numpy()
+        return StoredSession(laps, results, meta)
+
 class LiveTimingIntegration:
-    def __init__(self):
+    def __init__(self, store=None):
         self.f1_available = False
-        self.current_session = None
+        self.store = store if store is not None else SessionStore()
+        self._loaded = (None, None)  # (session key, session), replaced as one reference
         self.live_data = {}
+        self._summary_cache = {}
+        self.driver_numbers = {}  # abbreviation -> driver number
+        self.driver_laps = {}     # driver number -> that driver's laps
+        self.sector_times = None  # float32 seconds, shape (driver, lap, sector)
+        self.sector_rows = {}     # driver number -> row in sector_times
+        self.replay = None        # SessionReplay feeding get_live_timing_data, if one is running
+    
+    @property
+    def session_key(self):
+        return self._loaded[0]
+    
+    @property
+    def current_session(self):
+        return self._loaded[1]
+    
+    def loaded_session(self):
+        """(session key, session) read in one step, so both always come from the same load"""
+        return self._loaded
         
     def initialize_fastf1(self):
         """Initialize FastF1 for F1 data"""
@@ -108,30 +431,107 @@ class LiveTimingIntegration:
             print("✅ FastF1 live timing available!")
             return True
         except ImportError:
-            print("❌ FastF1 not installed. Live F1 timing disabled.")
+            print("❌ FastF1 not installed (pip install fastf1). Live F1 timing disabled.")
             self.f1_available = False
             return False
     
+    @perf.timed('timing.load_f1_session')
     def load_f1_session(self, year=2024, event='Bahrain Grand Prix', session='R'):
-        """Load F1 session data"""
-        if not self.f1_available:
+        """Load F1 session data, from the session store when it has been loaded before"""
+        stored = self.store.load(year, event, session)
+        perf.count('cache.session_store.miss' if stored is None else 'cache.session_store.hit')
+        if stored is None and not self.f1_available:
             return False
             
         try:
-            import fastf1
-            # Enable cache to avoid re-downloading
-            fastf1.Cache.enable_cache('./f1_cache')
+            if stored is not None:
+                print(f"🏎️  Loading F1 {year} {event} - {session} from session store...")
+                loaded = stored
+            else:
+                import fastf1
+                # Enable cache to avoid re-downloading
+                fastf1.Cache.enable_cache('./f1_cache')
+                
+                print(f"🏎️  Loading F1 {year} {event} - {session}...")
+                with perf.timer('external.fastf1_load'):
+                    loaded = fastf1.get_session(year, event, session)
+                    loaded.load()
+                try:
+                    self.store.save(year, event, session, loaded)
+                except Exception as e:
+                    print(f"⚠️ Could not save session to store: {e}")
+            driver_numbers, driver_laps = self._build_driver_index(loaded)
+            sector_rows, sector_times = self._build_sector_times(loaded)
             
-            print(f"🏎️  Loading F1 {year} {event} - {session}...")
-            self.current_session = fastf1.get_session(year, event, session)
-            self.current_session.load()
+            # Other threads read these while a load runs: the indexes go in first and the
+            # session is published together with its key in a single assignment
+            self.replay = None
+            self.driver_numbers, self.driver_laps = driver_numbers, driver_laps
+            self.sector_rows, self.sector_times = sector_rows, sector_times
+            self._loaded = ((year, event, session), loaded)
             
-            print(f"✅ F1 session loaded: {len(self.current_session.laps)} laps available")
+            print(f"✅ F1 session loaded: {len(loaded.laps)} laps available")
             return True
         except Exception as e:
             print(f"❌ F1 session load failed: {e}")
             return False
     
+    @staticmethod
+    def _build_driver_index(session):
+        """Index drivers by abbreviation and pre-slice their laps once per loaded session"""
+        results = session.results
+        driver_numbers = dict(zip(results['Abbreviation'], results['DriverNumber']))
+        driver_laps = dict(tuple(session.laps.groupby('DriverNumber', sort=False)))
+        return driver_numbers, driver_laps
+    
+    @staticmethod
+    def _build_sector_times(session):
+        """Scatter every lap's Sector1-3 times into a (driver, lap, sector) float32 array"""
+        import pandas as pd
+        laps = session.laps
+        drivers = list(session.drivers)
+        sector_rows = {driver: i for i, driver in enumerate(drivers)}
+        
+        rows = pd.Index(drivers).get_indexer(laps['DriverNumber'])
+        lap_numbers = laps['LapNumber'].to_numpy(dtype=float)
+        valid = (rows >= 0) & ~np.isnan(lap_numbers)
+        n_laps = int(np.nanmax(lap_numbers)) if valid.any() else 0
+        
+        sectors = np.column_stack([
+            laps[f'Sector{i}Time'].dt.total_seconds().to_numpy(dtype=float) for i in (1, 2, 3)
+        ]).astype(np.float32)
+        cube = np.full((len(drivers), n_laps, 3), np.nan, dtype=np.float32)
+        cube[rows[valid], lap_numbers[valid].astype(int) - 1] = sectors[valid]
+        return sector_rows, cube
+    
+    def get_best_sectors(self):
+        """Best time per sector for every driver, shape (driver, 3)"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN rows for drivers without sector data
+            return np.nanmin(self.sector_times, axis=1)
+    
+    def get_rolling_sectors(self, window=5):
+        """Mean of each sector over the trailing `window` laps, shape (driver, lap, sector)"""
+        times = self.sector_times
+        present = ~np.isnan(times)
+        totals = np.cumsum(np.where(present, times, 0), axis=1, dtype=np.float64)
+        counts = np.cumsum(present, axis=1)
+        totals[:, window:] -= totals[:, :-window]
+        counts[:, window:] -= counts[:, :-window]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (totals / counts).astype(np.float32)
+    
+    def get_theoretical_best_laps(self):
+        """Sum of each driver's best sectors, shape (driver,)"""
+        return self.get_best_sectors().sum(axis=1)
+    
+    def get_sector_deltas(self):
+        """Each driver's best sectors minus the session-best sectors, shape (driver, 3)"""
+        best = self.get_best_sectors()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return best - np.nanmin(best, axis=0)
+    
     def get_session_info(self):
         """Get basic session information"""
         if not self.current_session:
@@ -145,27 +545,71 @@ class LiveTimingIntegration:
             'session_time': self.current_session.session_start_time
         }
     
+    @perf.timed('timing.get_driver_summary')
+    def get_driver_summary(self):
+        """Per-driver latest lap and lap-time stats for the loaded session, computed in one groupby pass"""
+        # One snapshot: a load finishing mid-groupby must not file this summary under its key
+        key, session = self.loaded_session()
+        if key in self._summary_cache:
+            perf.count('cache.driver_summary.hit')
+            return self._summary_cache[key]
+        perf.count('cache.driver_summary.miss')
+        
+        import pandas as pd
+        laps = session.laps
+        frame = pd.DataFrame({
+            'DriverNumber': laps['DriverNumber'].to_numpy(),
+            'LapNumber': laps['LapNumber'].to_numpy(),
+            'LapTime': laps['LapTime'].dt.total_seconds().to_numpy(),
+            'Compound': laps['Compound'].to_numpy(),
+            'Position': laps['Position'].to_numpy(),
+        })
+        grouped = frame.groupby('DriverNumber', sort=False)
+        
+        stats = grouped['LapTime'].agg(fastest_lap='min', average_lap='mean', consistency='std', laps_completed='size')
+        latest = grouped.tail(1).set_index('DriverNumber').rename(columns={
+            'LapNumber': 'lap_number', 'LapTime': 'lap_time', 'Compound': 'compound', 'Position': 'position'})
+        
+        info = session.results.set_index('DriverNumber')[['Abbreviation', 'FullName', 'TeamName']]
+        summary = latest.join(stats).join(info)
+        # Keep the session's driver order so ties sort the same way as before
+        summary = summary.reindex([d for d in session.drivers if d in summary.index])
+        
+        self._summary_cache[key] = summary
+        return summary
+    
+    def start_replay(self, speed=REPLAY_SPEED):
+        """Stream the loaded session's laps through get_live_timing_data as if live"""
+        self.replay = SessionReplay(self, speed).start()
+        return self.replay
+    
+    def stop_replay(self):
+        self.replay = None
+    
+    @perf.timed('timing.get_live_timing_data')
     def get_live_timing_data(self):
         """Get simulated live timing data"""
         if not self.current_session:
             return self._get_simulated_timing_data()
+        if self.replay:
+            return self.replay.get_live_timing_data()
             
         try:
-            # Get the latest lap for each driver
-            timing_data = []
-            for driver in self.current_session.drivers:
-                driver_laps = self.current_session.laps.pick_driver(driver)
-                if len(driver_laps) > 0:
-                    latest_lap = driver_laps.iloc[-1]
-                    timing_data.append({
-                        'driver': driver,
-                        'driver_name': self.current_session.get_driver(driver)['Abbreviation'],
-                        'team': self.current_session.get_driver(driver)['TeamName'],
-                        'lap_time': latest_lap['LapTime'].total_seconds() if pd.notna(latest_lap['LapTime']) else None,
-                        'lap_number': latest_lap['LapNumber'],
-                        'compound': latest_lap['Compound'],
-                        'position': latest_lap['Position'] if pd.notna(latest_lap['Position']) else None
-                    })
+            import pandas as pd
+            # Latest lap for every driver, straight from the cached summary
+            summary = self.get_driver_summary()
+            timing_data = [
+                {
+                    'driver': driver,
+                    'driver_name': row.Abbreviation,
+                    'team': row.TeamName,
+                    'lap_time': row.lap_time if pd.notna(row.lap_time) else None,
+                    'lap_number': row.lap_number,
+                    'compound': row.compound,
+                    'position': row.position if pd.notna(row.position) else None
+                }
+                for driver, row in zip(summary.index, summary.itertuples(index=False))
+            ]
             
             return sorted(timing_data, key=lambda x: x['position'] if x['position'] is not None else 999)
         except Exception as e:
@@ -202,32 +646,29 @@ class LiveTimingIntegration:
         
         return timing_data
     
+    @perf.timed('timing.get_driver_analysis')
     def get_driver_analysis(self, driver_code):
         """Get detailed analysis for a specific driver"""
         if not self.current_session:
             return self._get_simulated_driver_analysis(driver_code)
             
         try:
-            # Find driver number by abbreviation
-            for driver in self.current_session.drivers:
-                driver_info = self.current_session.get_driver(driver)
-                if driver_info['Abbreviation'] == driver_code:
-                    driver_laps = self.current_session.laps.pick_driver(driver)
-                    
-                    if len(driver_laps) > 0:
-                        fastest_lap = driver_laps['LapTime'].min()
-                        avg_lap = driver_laps['LapTime'].mean()
-                        consistency = driver_laps['LapTime'].std()
-                        
-                        return {
-                            'driver_name': driver_info['FullName'],
-                            'team': driver_info['TeamName'],
-                            'fastest_lap': fastest_lap.total_seconds(),
-                            'average_lap': avg_lap.total_seconds(),
-                            'consistency': consistency.total_seconds(),
-                            'laps_completed': len(driver_laps),
-                            'best_sector_times': self._get_sector_times(driver_laps)
-                        }
+            summary = self.get_driver_summary()
+            driver = self.driver_numbers.get(driver_code)
+            
+            if driver in self.driver_laps and driver in summary.index:
+                row = summary.loc[driver]
+                driver_laps = self.driver_laps[driver]
+                
+                return {
+                    'driver_name': row['FullName'],
+                    'team': row['TeamName'],
+                    'fastest_lap': float(row['fastest_lap']),
+                    'average_lap': float(row['average_lap']),
+                    'consistency': float(row['consistency']),
+                    'laps_completed': int(row['laps_completed']),
+                    'best_sector_times': self._get_sector_times(driver)
+                }
             
             return self._get_simulated_driver_analysis(driver_code)
         except Exception as e:
@@ -250,30 +691,705 @@ class LiveTimingIntegration:
             }
         }
     
-    def _get_sector_times(self, driver_laps):
-        """Extract sector times from lap data"""
-        # Simplified sector time extraction
+    def _get_sector_times(self, driver):
+        """Best sector times for a driver from the session's sector array"""
+        best = self.get_best_sectors()[self.sector_rows[driver]]
+        return {
+            'sector1': float(best[0]),
+            'sector2': float(best[1]),
+            'sector3': float(best[2])
+        }
+
+class SessionReplay:
+    """Replays a loaded session's laps in the order they were completed
+    
+    Each driver's laps are a generator of lap-end events; a heap keyed by session
+    time merges them, so only one pending lap per driver is held at a time. The
+    replay clock runs `speed` times faster than wall time and timing snapshots
+    have the same shape as LiveTimingIntegration.get_live_timing_data.
+    """
+    
+    def __init__(self, live_timing, speed=REPLAY_SPEED, clock=time.monotonic):
+        self.speed = speed
+        self.clock = clock
+        results = live_timing.current_session.results
+        self.names = dict(zip(results['DriverNumber'], zip(results['Abbreviation'], results['TeamName'])))
+        self.latest = {}  # driver number -> timing entry for their most recent completed lap
+        self._heap = []
+        self._order = itertools.count()  # tie-break for laps finishing at the same session time
+        for driver, laps in live_timing.driver_laps.items():
+            self._push(self._driver_events(driver, laps))
+        
+        laps = live_timing.current_session.laps
+        self.start_time = self._heap[0][0] if self._heap else 0.0
+        if 'LapStartTime' in laps and laps['LapStartTime'].notna().any():
+            self.start_time = laps['LapStartTime'].dt.total_seconds().min()
+        self.session_time = self.start_time
+        self._wall_start = None
+        self._lock = threading.Lock()  # advanced from the dashboard thread and the menu
+    
+    def _driver_events(self, driver, laps):
+        """Yield (session seconds, timing entry) for each of a driver's laps, in lap order"""
+        abbreviation, team = self.names.get(driver, (driver, ''))
+        columns = zip(
+            laps['Time'].dt.total_seconds().to_numpy(),
+            laps['LapTime'].dt.total_seconds().to_numpy(),
+            laps['LapNumber'].to_numpy(),
+            laps['Compound'].to_numpy(),
+            laps['Position'].to_numpy(dtype=float),
+        )
+        for finished, lap_time, lap_number, compound, position in columns:
+            if np.isnan(finished):
+                continue
+            yield finished, {
+                'driver': driver,
+                'driver_name': abbreviation,
+                'team': team,
+                'lap_time': None if np.isnan(lap_time) else lap_time,
+                'lap_number': lap_number,
+                'compound': compound,
+                'position': None if np.isnan(position) else position
+            }
+    
+    def _push(self, events):
+        event = next(events, None)
+        if event is not None:
+            heapq.heappush(self._heap, (event[0], next(self._order), event[1], events))
+    
+    @property
+    def finished(self):
+        return not self._heap
+    
+    def events(self):
+        """Yield (session seconds, timing entry) for every remaining lap, without pacing"""
+        while self._heap:
+            finished, _, entry, events = heapq.heappop(self._heap)
+            self._push(events)
+            self.session_time = finished
+            self.latest[entry['driver']] = entry
+            yield finished, entry
+    
+    def advance_to(self, session_time):
+        """Apply every lap completed by `session_time`; returns how many were applied"""
+        applied = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= session_time:
+                finished, _, entry, events = heapq.heappop(self._heap)
+                self._push(events)
+                self.latest[entry['driver']] = entry
+                applied += 1
+            self.session_time = max(self.session_time, session_time)
+        return applied
+    
+    def start(self):
+        """Start the replay clock from the beginning of the session"""
+        self._wall_start = self.clock()
+        return self
+    
+    def now(self):
+        """Current replay session time in seconds"""
+        if self._wall_start is None:
+            return self.session_time
+        return self.start_time + (self.clock() - self._wall_start) * self.speed
+    
+    def get_live_timing_data(self):
+        """Timing as of the replay clock, sorted by position"""
+        self.advance_to(self.now())
+        return sorted(self.latest.values(), key=lambda x: x['position'] if x['position'] is not None else 999)
+
+class PaceModel:
+    """Per-driver, per-stint tyre degradation on fuel-corrected lap times
+    
+    Each stint is fitted as corrected lap time = pace + deg * tyre age. Every stint
+    is solved at once from per-stint running sums, so folding in newly completed
+    laps (e.g. while a SessionReplay runs) only touches those laps. Fits are cached
+    per session and number of laps folded in.
+    """
+    
+    def __init__(self, live_timing):
+        self.live_timing = live_timing
+        self._session_key = None
+        self._fits = {}  # laps folded in -> (stint fit, compound model)
+    
+    def _clean_laps(self, laps):
+        """Mask of green-flag laps away from the pits with a lap time and tyre age"""
+        lap_time = laps['LapTime'].dt.total_seconds().to_numpy(dtype=float)
+        clean = ~np.isnan(lap_time) & laps['TyreLife'].notna().to_numpy() & (laps['LapNumber'] > 1).to_numpy()
+        for column in ('PitInTime', 'PitOutTime'):
+            if column in laps:
+                clean &= laps[column].isna().to_numpy()
+        if 'TrackStatus' in laps:
+            clean &= (laps['TrackStatus'] == '1').to_numpy()
+        if clean.any():
+            clean &= lap_time < 1.07 * np.median(lap_time[clean])
+        return clean
+    
+    def _prepare(self):
+        """Lay out the session's clean laps in finishing order, once per session"""
+        # Key first: if a load lands in between, the stale key just triggers another _prepare
+        session_key = self.live_timing.session_key
+        session = self.live_timing.current_session
+        laps = session.laps
+        self.race_laps = int(getattr(session, 'total_laps', None) or np.nanmax(laps['LapNumber']))
+        
+        clean = self._clean_laps(laps) & laps['Stint'].notna().to_numpy()
+        stints = laps[clean].groupby(['DriverNumber', 'Stint'], sort=False)
+        group = stints.ngroup().to_numpy()
+        first = stints.head(1)
+        self.stint_driver = first['DriverNumber'].to_numpy()
+        self.stint_number = first['Stint'].to_numpy(dtype=float)
+        self.stint_compound = first['Compound'].fillna('').astype(str).to_numpy()
+        
+        clean_laps = laps[clean]
+        lap_time = clean_laps['LapTime'].dt.total_seconds().to_numpy(dtype=float)
+        lap_number = clean_laps['LapNumber'].to_numpy(dtype=float)
+        finished = clean_laps['Time'].dt.total_seconds().to_numpy(dtype=float)
+        order = np.argsort(finished, kind='stable')
+        self._finished = finished[order]
+        self._group = group[order]
+        self._age = clean_laps['TyreLife'].to_numpy(dtype=float)[order]
+        self._corrected = (lap_time - FUEL_EFFECT * (self.race_laps - lap_number))[order]
+        
+        self._sums = np.zeros((6, len(first)))  # n, Σage, Σtime, Σage², Σage·time, Σtime²
+        self._folded = 0
+        self._fits = {}
+        self._session_key = session_key
+    
+    def update(self, until=None):
+        """Fold in clean laps finished by session time `until` (all of them when None)"""
+        if self.live_timing.session_key is None:
+            raise RuntimeError("PaceModel needs a loaded session")
+        if self._session_key != self.live_timing.session_key:
+            self._prepare()
+        end = len(self._finished) if until is None else int(np.searchsorted(self._finished, until, 'right'))
+        if end < self._folded:  # the replay went back to the start
+            self._sums[:] = 0
+            self._folded = 0
+        if end > self._folded:
+            new = slice(self._folded, end)
+            group, age, corrected = self._group[new], self._age[new], self._corrected[new]
+            for row, weights in enumerate((None, age, corrected, age * age, age * corrected, corrected * corrected)):
+                self._sums[row] += np.bincount(group, weights, minlength=self._sums.shape[1])
+            self._folded = end
+        return self._folded
+    
+    def _sync(self):
+        replay = self.live_timing.replay
+        if replay is None:
+            return self.update()
+        # session_time only moves when the replay is advanced, so catch it up to its clock first
+        replay.advance_to(replay.now())
+        return self.update(replay.session_time)
+    
+    @perf.timed('model.stint_fit')
+    def stint_fit(self):
+        """Arrays per stint: driver, stint, compound, laps, pace, deg, residual sum of squares, valid"""
+        folded = self._sync()
+        perf.count('cache.pace_fit.hit' if folded in self._fits else 'cache.pace_fit.miss')
+        if folded not in self._fits:
+            n, sx, sy, sxx, sxy, syy = self._sums
+            with np.errstate(invalid='ignore', divide='ignore'):
+                spread = n * sxx - sx * sx
+                valid = (n >= MIN_FIT_LAPS) & (spread > 0)
+                deg = np.where(valid, (n * sxy - sx * sy) / spread, np.nan)
+                pace = np.where(valid, (sy - deg * sx) / n, np.nan)
+                # Σ(y - pace - deg·x)² expanded in terms of the running sums
+                rss = syy - 2 * pace * sy - 2 * deg * sxy + n * pace ** 2 + 2 * pace * deg * sx + deg ** 2 * sxx
+            fit = {
+                'driver': self.stint_driver, 'stint': self.stint_number, 'compound': self.stint_compound,
+                'laps': n, 'pace': pace, 'deg': deg, 'rss': np.maximum(rss, 0), 'valid': valid,
+                'corrected_total': sy,
+            }
+            self._fits = {folded: (fit, self._compound_model(fit))}
+        return self._fits[folded][0]
+    
+    def _compound_model(self, fit):
+        """Lap-weighted average of the stint fits for each dry compound"""
+        valid = fit['valid']
+        if not valid.any():
+            return None
+        lap_sigma = float(np.sqrt(fit['rss'][valid].sum() / max(fit['laps'][valid].sum() - 2 * valid.sum(), 1)))
+        compounds, pace, deg, pace_se, deg_se = [], [], [], [], []
+        for compound in DRY_COMPOUNDS:
+            used = valid & (fit['compound'] == compound)
+            if not used.any():
+                continue
+            weights = fit['laps'][used]
+            compounds.append(compound)
+            for values, mean, se in ((fit['pace'][used], pace, pace_se), (fit['deg'][used], deg, deg_se)):
+                average = np.average(values, weights=weights)
+                variance = np.average((values - average) ** 2, weights=weights)
+                mean.append(average)
+                se.append(np.sqrt(variance / used.sum() + lap_sigma ** 2 / weights.sum()))
+        if len(compounds) < 2:
+            return None
+        return {
+            'compounds': compounds,
+            'pace': np.array(pace), 'deg': np.array(deg), 'fuel': FUEL_EFFECT,
+            'pace_se': np.array(pace_se), 'deg_se': np.array(deg_se),
+            'lap_sigma': lap_sigma, 'laps_used': int(fit['laps'][valid].sum()),
+            'stints_used': int(valid.sum()), 'race_laps': self.race_laps,
+        }
+    
+    def compound_model(self):
+        """Per-compound pace/degradation in StrategySimulator's format, or None if too few stints"""
+        if self.live_timing.session_key is None:
+            return None
+        self.stint_fit()
+        return self._fits[self._folded][1]
+    
+    def driver_pace(self):
+        """Per driver: fuel-corrected average lap, lap-weighted degradation and their latest stint"""
+        if self.live_timing.session_key is None:
+            return []
+        fit = self.stint_fit()
+        names = dict(zip(self.live_timing.current_session.results['DriverNumber'],
+                         self.live_timing.current_session.results['Abbreviation']))
+        drivers = []
+        for driver in dict.fromkeys(fit['driver']):
+            mine = (fit['driver'] == driver) & (fit['laps'] > 0)
+            if not mine.any():
+                continue
+            valid = mine & fit['valid']
+            latest = np.flatnonzero(mine)[np.argmax(fit['stint'][mine])]
+            drivers.append({
+                'driver': driver,
+                'driver_name': names.get(driver, driver),
+                'corrected_pace': float(fit['corrected_total'][mine].sum() / fit['laps'][mine].sum()),
+                'deg': float(np.average(fit['deg'][valid], weights=fit['laps'][valid])) if valid.any() else None,
+                'stints': int(mine.sum()),
+                'current_compound': fit['compound'][latest],
+                'current_deg': None if np.isnan(fit['deg'][latest]) else float(fit['deg'][latest]),
+                'clean_laps': int(fit['laps'][mine].sum()),
+            })
+        return sorted(drivers, key=lambda x: x['corrected_pace'])
+
+def _load_event_summary(year, event, session, order, store_root):
+    """Load one session and reduce it to a per-driver summary frame
+    
+    Runs in a SeasonTable worker process; returns (summary or None, new store entries).
+    """
+    store = SessionStore(store_root, write_index=False)
+    live_timing = LiveTimingIntegration(store)
+    live_timing.initialize_fastf1()
+    if not live_timing.load_f1_session(year, event, session):
+        return None, store.unindexed
+    
+    summary = live_timing.get_driver_summary()
+    best = live_timing.get_theoretical_best_laps()
+    rows = [live_timing.sector_rows.get(driver, -1) for driver in summary.index]
+    theoretical = np.where(np.array(rows) >= 0, best[rows], np.nan)
+    table = summary.reset_index().rename(columns={
+        'DriverNumber': 'driver', 'Abbreviation': 'driver_name', 'FullName': 'full_name', 'TeamName': 'team'})
+    table = table[['driver', 'driver_name', 'full_name', 'team', 'position', 'fastest_lap',
+                   'average_lap', 'consistency', 'laps_completed']]
+    table['theoretical_best'] = theoretical
+    # Relative pace makes laps comparable across circuits of different length
+    table['pace_pct'] = table['fastest_lap'] / table['fastest_lap'].min() * 100
+    table.insert(0, 'order', order)
+    table.insert(0, 'session', session)
+    table.insert(0, 'event', live_timing.current_session.event['EventName'])
+    table.insert(0, 'year', year)
+    return table, store.unindexed
+
+class SeasonTable:
+    """Per-driver summaries for many sessions, loaded in parallel processes
+    
+    Each worker loads one event (from the session store when possible) and returns
+    only the compact per-driver summary. The merged table is pivoted once per load,
+    so head-to-head and trend queries are column lookups instead of reloads.
+    """
+    
+    def __init__(self, store=None):
+        self.store = store if store is not None else SessionStore()
+        self.table = None
+        self.failed = []
+        self._wide = None
+    
+    @perf.timed('timing.season_load')
+    def load(self, events, year=2024, session='R', workers=None):
+        """Load `events` (in calendar order) and merge their summaries; returns events loaded"""
+        import pandas as pd
+        self.failed = []
+        if not events:
+            return 0
+        workers = workers or min(len(events), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_load_event_summary, year, event, session, order, self.store.root)
+                       for order, event in enumerate(events)]
+            results = [future.result() for future in futures]
+        
+        frames = []
+        for event, (frame, entries) in zip(events, results):
+            if entries:
+                self.store.add_entries(entries)
+            if frame is None:
+                self.failed.append(event)
+            else:
+                frames.append(frame)
+        if not frames:
+            return 0
+        
+        self.table = pd.concat(frames, ignore_index=True)
+        self._wide = self.table.pivot_table(
+            index=['order', 'event'], columns='driver_name',
+            values=['position', 'fastest_lap', 'average_lap', 'pace_pct'], aggfunc='first')
+        return len(frames)
+    
+    def head_to_head(self, driver_a, driver_b):
+        """Finishing positions and fastest-lap gap for two drivers across shared events"""
+        position = self._wide['position'].reindex(columns=[driver_a, driver_b])
+        gap = self._wide['fastest_lap'].reindex(columns=[driver_a, driver_b])
+        shared = position.notna().all(axis=1)
+        position, gap = position[shared], gap[driver_a][shared] - gap[driver_b][shared]
+        return {
+            'events': int(shared.sum()),
+            'ahead': {driver_a: int((position[driver_a] < position[driver_b]).sum()),
+                      driver_b: int((position[driver_b] < position[driver_a]).sum())},
+            'mean_lap_gap': float(gap.mean()) if len(gap) else None,
+            'rows': [
+                {'event': event, driver_a: position[driver_a].iloc[i], driver_b: position[driver_b].iloc[i],
+                 'lap_gap': float(gap.iloc[i])}
+                for i, (_, event) in enumerate(position.index)
+            ],
+        }
+    
+    def trend(self, driver, metric='pace_pct'):
+        """A driver's `metric` over the loaded events and its slope per event"""
+        values = self._wide[metric].get(driver)
+        values = values.dropna() if values is not None else values
+        if values is None or values.empty:
+            return None
+        order = values.index.get_level_values('order').to_numpy(dtype=float)
+        slope = float(np.polyfit(order, values.to_numpy(dtype=float), 1)[0]) if len(values) > 1 else 0.0
         return {
-            'sector1': 25.1 + np.random.random() * 0.5,
-            'sector2': 32.8 + np.random.random() * 0.5,
-            'sector3': 27.3 + np.random.random() * 0.5
+            'events': list(values.index.get_level_values('event')),
+            'values': values.to_numpy(dtype=float),
+            'slope': slope,
         }
 
+def _simulate_strategies(params, n, seed):
+    """Total race time for every strategy in `n` simulated races, shape (strategy, n)
+    
+    Module level so ProcessPoolExecutor workers can run it.
+    """
+    rng = np.random.default_rng(seed)
+    race_laps = params['race_laps']
+    counts, tyre_age, stops = params['counts'], params['tyre_age'], params['stops']
+    
+    # Pace and degradation uncertainty from the fit, shared by every strategy in a race
+    pace = params['pace'] + params['pace_se'] * rng.standard_normal((n, counts.shape[1]))
+    deg = (params['deg'] + params['deg_se'] * rng.standard_normal((n, counts.shape[1]))) * params['deg_factor']
+    total = counts @ pace.T + tyre_age @ deg.T + params['fuel_total']
+    total += params['lap_sigma'] * np.sqrt(race_laps) * rng.standard_normal(total.shape)
+    
+    # Safety cars: deployments last SAFETY_CAR_LAPS laps and halve the cost of stopping
+    deployed = np.cumsum(rng.random((n, race_laps)) < params['sc_prob'], axis=1)
+    under_sc = (deployed - np.pad(deployed, ((0, 0), (SAFETY_CAR_LAPS, 0)))[:, :race_laps]) > 0
+    sc_stops = stops.astype(np.float64) @ under_sc.T
+    total += stops.sum(axis=1, keepdims=True) * PIT_LOSS - sc_stops * (PIT_LOSS - SC_PIT_LOSS)
+    
+    # Rain forces an extra stop unless a planned one falls just after it starts
+    rain_start = np.where(rng.random(n) < params['rain_prob'], rng.integers(1, race_laps, n), race_laps)
+    planned = np.concatenate([np.zeros((len(stops), 1)), np.cumsum(stops, axis=1)], axis=1)
+    window = planned[:, np.minimum(rain_start + RAIN_SWITCH_WINDOW, race_laps)] - planned[:, rain_start]
+    total += np.where((rain_start < race_laps) & (window == 0), PIT_LOSS, 0.0)
+    return total
+
+class StrategySimulator:
+    """Monte Carlo race strategy engine
+    
+    Lap time is modelled per dry compound as pace + degradation * tyre age, plus
+    FUEL_EFFECT per lap of fuel left, taken from the session's PaceModel (or a
+    generic model without one). Every one- and two-stop strategy is screened
+    with SCREEN_SIMULATIONS races, then the best STRATEGY_FINALISTS are re-run with
+    STRATEGY_SIMULATIONS races that add safety cars and weather.
+    """
+    
+    # Generic compound model used without a session: pace offset (s), deg (s/lap)
+    DEFAULT_MODEL = {'SOFT': (0.0, 0.09), 'MEDIUM': (0.5, 0.055), 'HARD': (0.9, 0.035)}
+    DEFAULT_BASE_LAP = 92.0
+    
+    def __init__(self, live_timing, pace_model=None, simulations=STRATEGY_SIMULATIONS, workers=STRATEGY_WORKERS):
+        self.live_timing = live_timing
+        self.pace = pace_model if pace_model is not None else PaceModel(live_timing)
+        self.simulations = simulations
+        self.workers = workers
+    
+    def compound_model(self, live=True):
+        """Per-compound pace and degradation for the loaded session, or the generic model
+        
+        live=False uses the generic model even if a session is loaded.
+        """
+        if live and self.live_timing.session_key is not None:
+            model = self.pace.compound_model()
+            if model is not None:
+                return model
+        return self._default_model()
+    
+    def _default_model(self):
+        compounds = list(self.DEFAULT_MODEL)
+        pace = np.array([self.DEFAULT_BASE_LAP + self.DEFAULT_MODEL[c][0] for c in compounds])
+        deg = np.array([self.DEFAULT_MODEL[c][1] for c in compounds])
+        return {
+            'compounds': compounds, 'pace': pace, 'deg': deg,
+            'pace_se': np.full(len(compounds), 0.3), 'deg_se': deg * 0.25,
+            'fuel': FUEL_EFFECT, 'lap_sigma': 0.6, 'laps_used': 0, 'race_laps': DEFAULT_RACE_LAPS,
+        }
+    
+    @staticmethod
+    def generate_strategies(compounds, race_laps, max_stops=2):
+        """(compound sequence, pit laps) for every legal strategy with up to `max_stops` stops"""
+        pit_window = range(MIN_STINT, race_laps - MIN_STINT + 1, PIT_LAP_STEP)
+        strategies = []
+        for stops in range(1, max_stops + 1):
+            for pit_laps in itertools.combinations(pit_window, stops):
+                if any(b - a < MIN_STINT for a, b in zip(pit_laps, pit_laps[1:])):
+                    continue
+                for sequence in itertools.product(compounds, repeat=stops + 1):
+                    if len(set(sequence)) >= 2:  # two dry compounds must be used
+                        strategies.append((sequence, pit_laps))
+        return strategies
+    
+    @staticmethod
+    def weather_effects(weather):
+        """Degradation scale from track temperature and rain probability from the forecast"""
+        if not weather:
+            return 1.0, 0.03
+        deg_factor = max(0.5, 1.0 + 0.015 * (weather['track_temp'] - DEG_TEMP_REFERENCE))
+        description = weather['description'].lower()
+        if any(word in description for word in ('rain', 'drizzle', 'shower', 'thunder')):
+            rain_prob = 0.7
+        elif weather['humidity'] >= 85:
+            rain_prob = 0.15
+        else:
+            rain_prob = 0.03
+        return deg_factor, rain_prob
+    
+    def _params(self, model, strategies, weather):
+        race_laps = model['race_laps']
+        column = {c: i for i, c in enumerate(model['compounds'])}
+        counts = np.zeros((len(strategies), len(column)))
+        tyre_age = np.zeros_like(counts)
+        stops = np.zeros((len(strategies), race_laps), dtype=bool)
+        for i, (sequence, pit_laps) in enumerate(strategies):
+            bounds = (0,) + pit_laps + (race_laps,)
+            for compound, start, end in zip(sequence, bounds, bounds[1:]):
+                length = end - start
+                counts[i, column[compound]] += length
+                tyre_age[i, column[compound]] += length * (length + 1) / 2
+            stops[i, [lap - 1 for lap in pit_laps]] = True
+        
+        deg_factor, rain_prob = self.weather_effects(weather)
+        return {
+            'counts': counts, 'tyre_age': tyre_age, 'stops': stops, 'race_laps': race_laps,
+            'pace': model['pace'], 'pace_se': model['pace_se'],
+            'deg': model['deg'], 'deg_se': model['deg_se'], 'deg_factor': deg_factor,
+            'fuel_total': model['fuel'] * race_laps * (race_laps - 1) / 2,
+            'lap_sigma': model['lap_sigma'], 'sc_prob': SAFETY_CAR_LAP_PROB, 'rain_prob': rain_prob,
+        }
+    
+    def _run(self, params, n, seed):
+        """Simulate `n` races, split across worker processes when configured"""
+        seeds = np.random.SeedSequence(seed).spawn(max(self.workers, 1))
+        if self.workers <= 1:
+            return _simulate_strategies(params, n, seeds[0])
+        chunks = [len(c) for c in np.array_split(np.arange(n), self.workers)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(_simulate_strategies, [params] * self.workers, chunks, seeds)
+            return np.concatenate(list(results), axis=1)
+    
+    @staticmethod
+    def label(sequence, pit_laps):
+        laps = ", ".join(f"L{lap}" for lap in pit_laps)
+        return f"{'-'.join(c[0] for c in sequence)} ({laps})"
+    
+    @perf.timed('model.rank_strategies')
+    def rank_strategies(self, weather=None, top=5, seed=None, live=True):
+        """Best strategies by mean race time, with 95% intervals and win probability"""
+        model = self.compound_model(live)
+        strategies = self.generate_strategies(model['compounds'], model['race_laps'])
+        
+        screen = self._run(self._params(model, strategies, weather), SCREEN_SIMULATIONS, seed)
+        finalists = [strategies[i] for i in np.argsort(screen.mean(axis=1))[:STRATEGY_FINALISTS]]
+        totals = self._run(self._params(model, finalists, weather), self.simulations, seed)
+        
+        wins = np.bincount(np.argmin(totals, axis=0), minlength=len(finalists)) / totals.shape[1]
+        low, high = np.percentile(totals, [2.5, 97.5], axis=1)
+        mean = totals.mean(axis=1)
+        ranked = np.argsort(mean)[:top]
+        return [
+            {
+                'strategy': self.label(*finalists[i]),
+                'compounds': finalists[i][0],
+                'pit_laps': finalists[i][1],
+                'mean': float(mean[i]),
+                'ci_low': float(low[i]),
+                'ci_high': float(high[i]),
+                'delta': float(mean[i] - mean[ranked[0]]),
+                'win_probability': float(wins[i]),
+            }
+            for i in ranked
+        ]
+    
+    @perf.timed('model.predict_qualifying')
+    def predict_qualifying(self, simulations=None, spread=0.15, seed=None, live=True):
+        """Pole probability and expected grid slot per driver from their one-lap potential
+        
+        live=False predicts from simulated timing even if a session is loaded.
+        """
+        simulations = simulations or self.simulations
+        timing = self.live_timing
+        if live and timing.session_key is not None:
+            summary = timing.get_driver_summary()
+            best = timing.get_theoretical_best_laps() if timing.sector_times is not None else None
+            drivers, potential = [], []
+            for driver, row in zip(summary.index, summary.itertuples(index=False)):
+                lap = best[timing.sector_rows[driver]] if best is not None and driver in timing.sector_rows else np.nan
+                potential.append(row.fastest_lap if np.isnan(lap) else lap)
+                drivers.append(row.Abbreviation)
+            potential = np.array(potential, dtype=float)
+            keep = ~np.isnan(potential)
+            drivers, potential = [d for d, k in zip(drivers, keep) if k], potential[keep]
+        else:
+            simulated = timing.get_live_timing_data()
+            drivers = [d['driver_name'] for d in simulated]
+            potential = np.array([d['lap_time'] for d in simulated]) - 1.0
+        
+        rng = np.random.default_rng(seed)
+        laps = potential[:, None] + spread * rng.standard_normal((len(drivers), simulations))
+        grid = np.argsort(np.argsort(laps, axis=0), axis=0) + 1
+        predictions = [
+            {
+                'driver_name': driver,
+                'predicted_lap': float(potential[i]),
+                'pole_probability': float((grid[i] == 1).mean()),
+                'expected_position': float(grid[i].mean()),
+            }
+            for i, driver in enumerate(drivers)
+        ]
+        return sorted(predictions, key=lambda x: x['expected_position'])
+
+def format_timing_row(driver):
+    """One dashboard row for a timing entry"""
+    lap_time = f"{driver['lap_time']:.3f}s" if driver['lap_time'] else "NO TIME"
+    gap = driver.get('gap_to_leader', '')
+    return (f"{driver['position']:<4} {driver['driver_name']:<8} {driver['team']:<15} "
+            f"{lap_time:<10} {driver['lap_number']:<4} {driver['compound']:<8} {gap:<10}")
+
+class LiveTimingDashboard:
+    """Redraws the timing table in place from a background thread
+    
+    Every `interval` seconds timing and weather are pulled again and compared
+    with the previous snapshot; only rows whose data changed are re-formatted
+    and rewritten, using ANSI cursor movement relative to the prompt line.
+    """
+    
+    def __init__(self, engineer, interval=DASHBOARD_REFRESH, rows=10):
+        self.engineer = engineer
+        self.interval = interval
+        self.rows = rows
+        self._previous = [None] * rows
+        self._previous_status = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.updates = 0
+        self.rows_redrawn = 0
+    
+    def _status_line(self):
+        # Runs on the refresh thread: only the weather cache is read, nothing is fetched or printed
+        engineer = self.engineer
+        updated = f"updated {datetime.now().strftime('%H:%M:%S')}"
+        weather = engineer.weather_integration.cached_weather(engineer.current_track)
+        if weather is None:
+            return f"🌤️ Weather unavailable | {updated}"
+        engineer.current_weather = weather
+        return f"🌤️ {weather['location']}: {weather['air_temp']}°C, {weather['description']} | {updated}"
+    
+    def _write_line(self, lines_up, text):
+        # Save cursor (on the prompt line), jump up to the row, rewrite it, restore
+        sys.stdout.write(f"\x1b7\x1b[{lines_up}A\r\x1b[2K{text}\x1b8")
+    
+    def _draw(self, first=False):
+        timing_data = self.engineer.live_timing.get_live_timing_data()[:self.rows]
+        status = self._status_line()
+        entries = [tuple(sorted(d.items())) for d in timing_data]
+        entries += [None] * (self.rows - len(entries))
+        
+        if first:
+            for entry, driver in zip(entries, timing_data + [None] * self.rows):
+                print(format_timing_row(driver) if entry else "")
+            print(status)
+        else:
+            # Row i sits (rows - i + 1) lines above the prompt; the status line is just above it
+            for i, entry in enumerate(entries):
+                if entry != self._previous[i]:
+                    self._write_line(self.rows - i + 1, format_timing_row(dict(entry)) if entry else "")
+                    self.rows_redrawn += 1
+            if status != self._previous_status:
+                self._write_line(1, status)
+            sys.stdout.flush()
+        self._previous = entries
+        self._previous_status = status
+        self.updates += 1
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._draw()
+            except Exception as e:
+                self._write_line(1, f"⚠️ Dashboard update failed: {e}")
+    
+    def run(self):
+        """Draw the table, keep it updating until the user presses Enter"""
+        print("\n" + "🏎️  LIVE TIMING DASHBOARD (auto-refresh)")
+        print("="*60)
+        print(f"{'POS':<4} {'DRIVER':<8} {'TEAM':<15} {'LAP TIME':<10} {'LAP':<4} {'TYRE':<8} {'GAP':<10}")
+        print("-" * 60)
+        self._draw(first=True)
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        try:
+            input("⏹  Press Enter to leave live mode ")
+        finally:
+            self._stop.set()
+            self._thread.join()
+
 class SuperchargedRaceEngineer:
-    def __init__(self):
+    def __init__(self, fast_start=False, delays=None):
         self.weather_integration = WeatherIntegration()
         self.live_timing = LiveTimingIntegration()
+        self.strategy = StrategySimulator(self.live_timing)
+        self.season = SeasonTable(self.live_timing.store)
         self.current_weather = None
         self.current_track = "bahrain"  # Default to F1 track
         self.user_name = ""
         self.team_name = ""
         self.f1_session_loaded = False
+        # Fast start skips the cosmetic pauses and goes to the menu while data loads;
+        # delays=False turns the pauses and typing effect off on their own (for benchmarking)
+        self.fast_start = fast_start
+        self.delays_enabled = (not fast_start) if delays is None else delays
+        self._loader = ThreadPoolExecutor(max_workers=2)
+        self._loading = {}  # feature -> Future of its background load
         
+    def _pause(self, seconds):
+        """Cosmetic pause, skipped when delays are disabled"""
+        if self.delays_enabled:
+            with perf.timer('cosmetic.pause'):
+                time.sleep(seconds)
+    
     def type_effect(self, text, delay=0.02):
         """Typing effect for bot messages"""
-        for char in text:
-            print(char, end='', flush=True)
-            time.sleep(delay)
+        if not self.delays_enabled:
+            print(text)
+            return
+        with perf.timer('cosmetic.typing'):
+            for char in text:
+                print(char, end='', flush=True)
+                time.sleep(delay)
         print()
     
     def print_bot_message(self, message, delay=0.02):
@@ -289,31 +1405,72 @@ class SuperchargedRaceEngineer:
         """Print timing-specific messages"""
         print(f"🏎️  TIMING: {message}")
     
+    def _load_timing(self):
+        """Import FastF1 and load the default session"""
+        if self.live_timing.initialize_fastf1():
+            self.f1_session_loaded = self.live_timing.load_f1_session(2024, 'Bahrain Grand Prix', 'R')
+    
+    def _load_weather(self):
+        """Fetch the current track's weather and warm the cache for the others"""
+        self.current_weather = self.weather_integration.get_track_weather(self.current_track)
+        self.weather_integration.refresh_all()
+    
+    def start_background_loading(self):
+        """Start timing and weather loading concurrently; returns immediately"""
+        self._loading = {
+            'timing': self._loader.submit(self._load_timing),
+            'weather': self._loader.submit(self._load_weather),
+        }
+    
+    def is_loading(self, feature):
+        future = self._loading.get(feature)
+        return future is not None and not future.done()
+    
+    def wait_until_ready(self, timeout=None):
+        """Block until background loading has finished; returns True if it all finished"""
+        done, not_done = wait(list(self._loading.values()), timeout)
+        return not not_done
+    
+    def _note_loading(self, feature, message):
+        if self.is_loading(feature):
+            print(f"⏳ {message}")
+    
+    def _session_ready(self, message):
+        """True when handlers can use the loaded session; otherwise notes the fallback and returns False
+        
+        Taken once per handler so a load finishing midway can't mix session and simulated data.
+        """
+        if self.is_loading('timing'):
+            print(f"⏳ {message}")
+            return False
+        return self.f1_session_loaded
+    
     def welcome_sequence(self):
         """Welcome user and set up all integrations"""
+        # Fast start overlaps loading with the greeting and the name prompts; otherwise it
+        # starts after them, so loader output can't land inside the typed lines
+        if self.fast_start:
+            self.start_background_loading()
+        
         self.print_bot_message("Hello! I'm your AI Race Engineer with LIVE WEATHER & TIMING! 🌤️🏎️")
-        time.sleep(1)
+        self._pause(1)
         
         self.print_bot_message("Initializing all data systems for maximum race intelligence!")
-        time.sleep(1)
+        self._pause(1)
         
         self.user_name = input("👤 What's your name? ")
         self.team_name = input("🏁 What's your team name? ")
         
         self.print_bot_message(f"Excellent! Welcome {self.user_name} from {self.team_name}!")
         
-        # Initialize FastF1
-        self.print_bot_message("Initializing live timing systems...")
-        self.live_timing.initialize_fastf1()
+        if self.fast_start:
+            self.print_system_message("⏳ Live timing and weather loading in the background")
+            self.print_bot_message("Menu is ready - data-backed features fill in as they load! 🚀")
+            return
         
-        # Try to load F1 session
-        if self.live_timing.f1_available:
-            self.print_bot_message("Loading latest F1 session data...")
-            self.f1_session_loaded = self.live_timing.load_f1_session(2024, 'Bahrain Grand Prix', 'R')
-        
-        # Get live weather data
-        self.print_bot_message("Connecting to live weather data...")
-        self.current_weather = self.weather_integration.get_track_weather(self.current_track)
+        self.print_bot_message("Initializing live timing and weather systems...")
+        self.start_background_loading()
+        self.wait_until_ready()
         
         self.print_system_message("✅ Weather integration ACTIVE")
         self.print_system_message("✅ Live timing systems READY")
@@ -332,11 +1489,15 @@ class SuperchargedRaceEngineer:
         # Weather status
         if self.current_weather:
             print(f"🌤️  Weather: ACTIVE - {self.current_weather['air_temp']}°C at {self.current_weather['location']}")
+        elif self.is_loading('weather'):
+            print("🌤️  Weather: LOADING...")
         else:
             print("🌤️  Weather: OFFLINE")
         
         # Timing status
-        if self.live_timing.f1_available:
+        if self.is_loading('timing'):
+            print("🏎️  Timing: LOADING...")
+        elif self.live_timing.f1_available:
             if self.f1_session_loaded:
                 session_info = self.live_timing.get_session_info()
                 print(f"🏎️  Timing: ACTIVE - {session_info['event']}")
@@ -354,12 +1515,18 @@ class SuperchargedRaceEngineer:
         print("="*60)
         
         # System status header
+        status = []
         if self.current_weather:
             weather = self.current_weather
-            status_line = f"🌤️ {weather['location']}: {weather['air_temp']}°C"
-            if self.f1_session_loaded:
-                status_line += " | 🏎️ LIVE TIMING ACTIVE"
-            print(status_line)
+            status.append(f"🌤️ {weather['location']}: {weather['air_temp']}°C")
+        elif self.is_loading('weather'):
+            status.append("🌤️ Weather loading...")
+        if self.f1_session_loaded:
+            status.append("🏎️ LIVE TIMING ACTIVE")
+        elif self.is_loading('timing'):
+            status.append("🏎️ Timing loading...")
+        if status:
+            print(" | ".join(status))
         
         print("\n1. 🎯 Qualifying Predictions (Live Data)")
         print("2. 📊 Race Pace Analysis (Real-time)") 
@@ -376,11 +1543,18 @@ class SuperchargedRaceEngineer:
         choice = input("🎮 Your command (0-9): ").strip()
         return choice
     
+    @perf.timed('handler.live_timing_dashboard')
     def handle_live_timing_dashboard(self):
         """Show live timing dashboard"""
         self.print_bot_message("Opening live timing dashboard...")
-        time.sleep(1)
+        self._note_loading('timing', "Session data still loading - showing simulated timing for now")
+        
+        if input("🔄 Auto-refresh live mode? (y/N): ").strip().lower() == 'y':
+            LiveTimingDashboard(self).run()
+            self.print_timing_message("Live mode stopped")
+            return
         
+        self._pause(1)
         timing_data = self.live_timing.get_live_timing_data()
         
         print("\n" + "🏎️  LIVE TIMING DASHBOARD")
@@ -388,12 +1562,8 @@ class SuperchargedRaceEngineer:
         print(f"{'POS':<4} {'DRIVER':<8} {'TEAM':<15} {'LAP TIME':<10} {'LAP':<4} {'TYRE':<8} {'GAP':<10}")
         print("-" * 60)
         
-        for i, driver in enumerate(timing_data[:10]):  # Show top 10
-            lap_time = f"{driver['lap_time']:.3f}s" if driver['lap_time'] else "NO TIME"
-            gap = driver.get('gap_to_leader', '')
-            
-            print(f"{driver['position']:<4} {driver['driver_name']:<8} {driver['team']:<15} "
-                  f"{lap_time:<10} {driver['lap_number']:<4} {driver['compound']:<8} {gap:<10}")
+        for driver in timing_data[:10]:  # Show top 10
+            print(format_timing_row(driver))
         
         # Session info
         if self.f1_session_loaded:
@@ -402,9 +1572,11 @@ class SuperchargedRaceEngineer:
         
         self.print_timing_message("Live timing data displayed")
     
+    @perf.timed('handler.driver_analysis')
     def handle_driver_analysis(self):
         """Detailed driver performance analysis"""
         self.print_bot_message("Which driver would you like to analyze?")
+        self._note_loading('timing', "Session data still loading - showing simulated timing for now")
         
         # Show available drivers from timing data
         timing_data = self.live_timing.get_live_timing_data()
@@ -419,7 +1591,7 @@ class SuperchargedRaceEngineer:
             driver_code = "HAM"  # Default
         
         self.print_bot_message(f"Analyzing performance data for {driver_code}...")
-        time.sleep(1)
+        self._pause(1)
         
         driver_analysis = self.live_timing.get_driver_analysis(driver_code)
         
@@ -449,12 +1621,17 @@ class SuperchargedRaceEngineer:
         
         self.print_bot_message(f"PERFORMANCE ASSESSMENT: {assessment}")
     
+    @perf.timed('handler.sector_analysis')
     def handle_sector_analysis(self):
         """Detailed sector time analysis"""
         self.print_bot_message("Analyzing sector times across the grid...")
-        time.sleep(1)
+        self._note_loading('timing', "Session data still loading - showing simulated timing for now")
+        self._pause(1)
         
         timing_data = self.live_timing.get_live_timing_data()
+        # With real sector data, strength is the sector closest to the session best
+        sector_rows = self.live_timing.sector_rows if self.live_timing.sector_times is not None else {}
+        deltas = self.live_timing.get_sector_deltas() if sector_rows else None
         
         print("\n" + "📊 SECTOR TIME ANALYSIS")
         print("="*50)
@@ -467,14 +1644,170 @@ class SuperchargedRaceEngineer:
             total = sum(sectors.values())
             
             # Find strongest sector
-            best_sector = min(sectors, key=sectors.get)
-            strength = f"S{best_sector[-1]} Strong"
+            if driver['driver'] in sector_rows and not np.isnan(deltas[sector_rows[driver['driver']]]).all():
+                strength = f"S{int(np.nanargmin(deltas[sector_rows[driver['driver']]])) + 1} Strong"
+            else:
+                best_sector = min(sectors, key=sectors.get)
+                strength = f"S{best_sector[-1]} Strong"
             
             print(f"{driver['driver_name']:<8} {sectors['sector1']:<10.3f} {sectors['sector2']:<10.3f} "
                   f"{sectors['sector3']:<10.3f} {total:<10.3f} {strength:<12}")
         
         self.print_timing_message("Sector analysis complete - identify track strengths!")
     
+    @perf.timed('handler.qualifying_predictions')
+    def handle_qualifying_predictions(self):
+        """Monte Carlo qualifying order from each driver's one-lap potential"""
+        self.print_bot_message("Generating live-data qualifying predictions...")
+        live = self._session_ready("Session data still loading - predicting from simulated timing")
+        predictions = self.strategy.predict_qualifying(live=live)
+        
+        print("\n" + "🎯 QUALIFYING PREDICTIONS")
+        print("="*50)
+        print(f"{'POS':<4} {'DRIVER':<8} {'POTENTIAL':<11} {'POLE %':<8} {'AVG GRID':<8}")
+        print("-" * 50)
+        for position, driver in enumerate(predictions[:10], 1):
+            potential = f"{driver['predicted_lap']:.3f}s"
+            print(f"{position:<4} {driver['driver_name']:<8} {potential:<11} "
+                  f"{driver['pole_probability']:<8.1%} {driver['expected_position']:<8.1f}")
+        
+        self.print_bot_message(f"Pole position favourite: {predictions[0]['driver_name']} "
+                               f"({predictions[0]['pole_probability']:.0%} of {self.strategy.simulations:,} runs)")
+    
+    @perf.timed('handler.race_pace')
+    def handle_race_pace(self):
+        """Fuel-corrected driver pace and fitted per-compound degradation"""
+        self.print_bot_message("Analyzing real-time race pace...")
+        live = self._session_ready("Session data still loading - using the generic compound model")
+        model = self.strategy.compound_model(live)
+        
+        if live:
+            print("\n" + "📊 FUEL-CORRECTED RACE PACE")
+            print("="*60)
+            print(f"{'DRIVER':<8} {'PACE':<10} {'DEG/LAP':<10} {'STINTS':<7} {'NOW ON':<8} {'STINT DEG':<10}")
+            print("-" * 60)
+            for driver in self.strategy.pace.driver_pace()[:10]:
+                pace = f"{driver['corrected_pace']:.3f}s"
+                deg = f"{driver['deg']:+.3f}s" if driver['deg'] is not None else "-"
+                current = f"{driver['current_deg']:+.3f}s" if driver['current_deg'] is not None else "-"
+                print(f"{driver['driver_name']:<8} {pace:<10} {deg:<10} {driver['stints']:<7} "
+                      f"{driver['current_compound']:<8} {current:<10}")
+        
+        print("\n" + "📊 RACE PACE BY COMPOUND")
+        print("="*50)
+        print(f"{'TYRE':<8} {'PACE':<10} {'DEG/LAP':<15} {'STINT 20 LAPS':<14}")
+        print("-" * 50)
+        for i, compound in enumerate(model['compounds']):
+            pace = f"{model['pace'][i]:.3f}s"
+            deg = f"{model['deg'][i]:+.3f}±{model['deg_se'][i]:.3f}s"
+            stint = f"{20 * model['pace'][i] + model['deg'][i] * 210:.1f}s"  # tyre ages 1..20 sum to 210
+            print(f"{compound:<8} {pace:<10} {deg:<15} {stint:<14}")
+        print(f"\n⛽ Fuel-corrected (empty tank), {model['fuel']:.3f}s per lap of fuel | Lap noise: ±{model['lap_sigma']:.2f}s | "
+              f"Fitted on {model['laps_used']} clean laps")
+        
+        self.print_bot_message("Race pace optimized!")
+    
+    def print_strategies(self, strategies):
+        print(f"{'#':<3} {'STRATEGY':<24} {'RACE TIME':<11} {'95% RANGE':<20} {'GAP':<8} {'WIN %':<6}")
+        print("-" * 75)
+        for rank, strategy in enumerate(strategies, 1):
+            race_time = f"{strategy['mean']:.1f}s"
+            spread = f"{strategy['ci_low']:.0f}-{strategy['ci_high']:.0f}s"
+            gap = f"{strategy['delta']:+.1f}s"
+            print(f"{rank:<3} {strategy['strategy']:<24} {race_time:<11} {spread:<20} "
+                  f"{gap:<8} {strategy['win_probability']:<6.1%}")
+    
+    @perf.timed('handler.tire_strategy')
+    def handle_tire_strategy(self):
+        """Rank pit strategies by simulated race time"""
+        self.print_bot_message("Calculating tire strategy with live data...")
+        live = self._session_ready("Session data still loading - using the generic compound model")
+        started = time.perf_counter()
+        strategies = self.strategy.rank_strategies(self.current_weather, live=live)
+        elapsed = time.perf_counter() - started
+        
+        deg_factor, rain_prob = self.strategy.weather_effects(self.current_weather)
+        print("\n" + "🛞 TIRE STRATEGY SIMULATION")
+        print("="*75)
+        print(f"🌡️  Degradation x{deg_factor:.2f} from track temp | 🌧️  Rain risk {rain_prob:.0%} | "
+              f"🚨 Safety car {SAFETY_CAR_LAP_PROB:.0%}/lap")
+        self.print_strategies(strategies)
+        
+        self.print_bot_message(f"Tire strategy updated! Best call: {strategies[0]['strategy']} "
+                               f"({self.strategy.simulations:,} races in {elapsed:.1f}s)")
+    
+    @perf.timed('handler.strategy_report')
+    def handle_strategy_report(self):
+        """Qualifying, pace and strategy in one report"""
+        self.print_bot_message("Generating comprehensive race report...")
+        live = self._session_ready("Session data still loading - report uses simulated data")
+        predictions = self.strategy.predict_qualifying(live=live)
+        model = self.strategy.compound_model(live)
+        strategies = self.strategy.rank_strategies(self.current_weather, top=3, live=live)
+        
+        print("\n" + "💡 FULL RACE STRATEGY REPORT")
+        print("="*75)
+        if live:
+            session_info = self.live_timing.get_session_info()
+            print(f"📊 {session_info['event']} - {session_info['session']}")
+        if self.current_weather:
+            print(f"🌤️  {self.current_weather['location']}: {self.current_weather['description']}, "
+                  f"track {self.current_weather['track_temp']}°C")
+        
+        front_row = ", ".join(f"{d['driver_name']} ({d['pole_probability']:.0%})" for d in predictions[:3])
+        print(f"\n🎯 Pole contenders: {front_row}")
+        fastest = model['compounds'][int(np.argmin(model['pace']))]
+        durable = model['compounds'][int(np.argmin(model['deg']))]
+        print(f"📊 Fastest compound: {fastest} | Most durable: {durable} | Race: {model['race_laps']} laps")
+        print("\n🛞 Top strategies:")
+        self.print_strategies(strategies)
+        
+        self.print_bot_message(f"Full strategy report ready! Recommended: {strategies[0]['strategy']}")
+    
+    @perf.timed('handler.season_comparison')
+    def handle_season_comparison(self):
+        """Load several events in parallel and compare drivers across them"""
+        if not self.live_timing.f1_available and not self.live_timing.store.entries():
+            self.print_bot_message("FastF1 not available and no stored sessions - season comparison needs real data")
+            return
+        
+        default = "Bahrain Grand Prix, Saudi Arabian Grand Prix, Australian Grand Prix"
+        events = input(f"Events in calendar order (Enter for {default}): ")
+        events = [event.strip() for event in events.split(',') if event.strip()]
+        if not events:
+            events = [event.strip() for event in default.split(',')]
+        
+        self.print_bot_message(f"Loading {len(events)} events in parallel...")
+        started = time.perf_counter()
+        loaded = self.season.load(events, 2024, 'R')
+        self.print_system_message(f"{loaded}/{len(events)} events loaded in {time.perf_counter() - started:.1f}s")
+        if self.season.failed:
+            self.print_system_message(f"Failed: {', '.join(self.season.failed)}")
+        if not loaded:
+            return
+        
+        driver_a = input("First driver code (e.g., VER): ").strip().upper() or "VER"
+        driver_b = input("Second driver code (e.g., LEC): ").strip().upper() or "LEC"
+        h2h = self.season.head_to_head(driver_a, driver_b)
+        
+        print(f"\n📅 HEAD TO HEAD: {driver_a} vs {driver_b}")
+        print("="*50)
+        print(f"{'EVENT':<28} {driver_a:<6} {driver_b:<6} {'LAP GAP':<8}")
+        print("-" * 50)
+        for row in h2h['rows']:
+            gap = f"{row['lap_gap']:+.3f}s"
+            print(f"{row['event'][:27]:<28} {row[driver_a]:<6.0f} {row[driver_b]:<6.0f} {gap:<8}")
+        if h2h['events']:
+            print(f"\n🏁 Ahead at the flag: {driver_a} {h2h['ahead'][driver_a]} - {h2h['ahead'][driver_b]} {driver_b} | "
+                  f"Mean fastest-lap gap {h2h['mean_lap_gap']:+.3f}s")
+        
+        for driver in (driver_a, driver_b):
+            trend = self.season.trend(driver)
+            if trend:
+                direction = "improving" if trend['slope'] < 0 else "fading"
+                print(f"📈 {driver}: fastest lap {trend['values'][-1]:.2f}% of the best, "
+                      f"{direction} {abs(trend['slope']):.2f}%/event")
+    
     def handle_system_management(self):
         """System and data management options"""
         print("\n" + "⚙️  SYSTEM MANAGEMENT")
@@ -484,24 +1817,96 @@ class SuperchargedRaceEngineer:
         print("3. 📍 Change Track Location")
         print("4. 🗑️  Clear Cache")
         print("5. 📊 System Status")
-        print("6. ↩️  Back to Main Menu")
+        print("6. ▶️  Replay Loaded Session")
+        print("7. 📅 Season Comparison")
+        print("8. ⏱️  Performance")
+        print("9. ↩️  Back to Main Menu")
         
-        choice = input("Select option (1-6): ").strip()
+        choice = input("Select option (1-9): ").strip()
         
         if choice == '1':
-            self.current_weather = self.weather_integration.get_track_weather(self.current_track)
+            self.current_weather = self.weather_integration.get_track_weather(self.current_track, force=True)
+            self.weather_integration.refresh_all()
             self.print_system_message("Weather data refreshed!")
         elif choice == '2':
-            if self.live_timing.f1_available:
+            if self.is_loading('timing'):
+                self.print_bot_message("Still loading the default session - try again in a moment")
+            elif self.live_timing.f1_available or self.live_timing.store.entries():
                 self.print_bot_message("Available F1 sessions: Bahrain, Saudi Arabia, Australia")
+                stored = [key.split('/')[1] for key in self.live_timing.store.entries() if key.startswith('2024/')]
+                if stored:
+                    print(f"💾 Instant from session store: {', '.join(stored)}")
                 event = input("Enter event name (or press Enter for Bahrain): ").strip()
                 if not event:
                     event = "Bahrain Grand Prix"
                 self.f1_session_loaded = self.live_timing.load_f1_session(2024, event, 'R')
             else:
                 self.print_bot_message("FastF1 not available - using simulated data")
+        elif choice == '3':
+            tracks = list(self.weather_integration.track_coordinates)
+            print(f"Available tracks: {', '.join(tracks)}")
+            track = input(f"Enter track (current: {self.current_track}): ").strip().lower()
+            if track in tracks:
+                self.current_track = track
+                self.current_weather = self.weather_integration.get_track_weather(track)
+                self.print_system_message(f"Track changed to {track.upper()}")
+            else:
+                self.print_system_message("Unknown track - location unchanged")
         elif choice == '5':
             self.show_system_status()
+        elif choice == '6':
+            if not self.f1_session_loaded:
+                self.print_bot_message("Load an F1 session first - replay needs real laps")
+            elif self.live_timing.replay:
+                self.live_timing.stop_replay()
+                self.print_system_message("Replay stopped - timing shows the full session")
+            else:
+                speed = input(f"Replay speed-up (Enter for {REPLAY_SPEED:g}x): ").strip()
+                try:
+                    speed = float(speed) if speed else REPLAY_SPEED
+                except ValueError:
+                    speed = REPLAY_SPEED
+                self.live_timing.start_replay(speed)
+                self.print_system_message(f"Replaying session at {speed:g}x - open the Live Timing Dashboard")
+        elif choice == '7':
+            self.handle_season_comparison()
+        elif choice == '8':
+            self.show_performance()
+    
+    def show_performance(self):
+        """Where the session's time went: handlers, integrations, external calls, caches, delays"""
+        print("\n" + "⏱️  PERFORMANCE")
+        print("="*62)
+        groups = [
+            ('handler', "Menu handlers"), ('timing', "Live timing"), ('weather', "Weather"),
+            ('model', "Models"), ('store', "Session store"), ('external', "External calls"),
+            ('cosmetic', "Cosmetic delays"),
+        ]
+        for prefix, title in groups:
+            rows = perf.group(prefix)
+            if not rows:
+                continue
+            print(f"\n{title}")
+            print(f"  {'NAME':<26} {'CALLS':>6} {'TOTAL':>10} {'AVG':>9} {'MAX':>9}")
+            for name, calls, total, longest in rows:
+                print(f"  {name:<26} {calls:>6} {total * 1000:>8.1f}ms {total / calls * 1000:>7.1f}ms "
+                      f"{longest * 1000:>7.1f}ms")
+        
+        caches = perf.cache_stats()
+        if caches:
+            print("\nCaches")
+            print(f"  {'NAME':<26} {'HITS':>6} {'MISSES':>7} {'HIT RATE':>9}")
+            for name, hits, misses in caches:
+                print(f"  {name:<26} {hits:>6} {misses:>7} {hits / (hits + misses):>9.0%}")
+        
+        print(f"\n🎬 Cosmetic delays: {'ON' if self.delays_enabled else 'OFF'}")
+        action = input("t = toggle delays, r = reset counters, Enter = back: ").strip().lower()
+        if action == 't':
+            self.delays_enabled = not self.delays_enabled
+            self.print_system_message(f"Cosmetic delays {'ON' if self.delays_enabled else 'OFF'}")
+        elif action == 'r':
+            perf.reset()
+            self.print_system_message("Performance counters reset")
     
     def run(self):
         """Main interaction loop"""
@@ -511,25 +1916,21 @@ class SuperchargedRaceEngineer:
             choice = self.show_enhanced_menu()
             
             if choice == '1':
-                self.print_bot_message("Generating live-data qualifying predictions...")
-                time.sleep(2)
-                self.print_bot_message("Pole position analysis complete!")
+                self.handle_qualifying_predictions()
                 
             elif choice == '2':
-                self.print_bot_message("Analyzing real-time race pace...")
-                time.sleep(2)
-                self.print_bot_message("Race pace optimized!")
+                self.handle_race_pace()
                 
             elif choice == '3':
-                self.print_bot_message("Calculating tire strategy with live data...")
-                time.sleep(2)
-                self.print_bot_message("Tire strategy updated!")
+                self.handle_tire_strategy()
                 
             elif choice == '4':
                 if self.current_weather:
                     print(f"\n🌤️  Current at {self.current_weather['location']}: {self.current_weather['description'].title()}")
                     print(f"🌡️  Air: {self.current_weather['air_temp']}°C | Track: {self.current_weather['track_temp']}°C")
                     print(f"💨 Wind: {self.current_weather['wind_speed']} m/s | 💧 Humidity: {self.current_weather['humidity']}%")
+                elif self.is_loading('weather'):
+                    self.print_bot_message("Weather data still loading - check back in a moment")
                 else:
                     self.print_bot_message("No weather data available")
                 
@@ -543,9 +1944,7 @@ class SuperchargedRaceEngineer:
                 self.handle_sector_analysis()
                 
             elif choice == '8':
-                self.print_bot_message("Generating comprehensive race report...")
-                time.sleep(2)
-                self.print_bot_message("Full strategy report ready!")
+                self.handle_strategy_report()
                 
             elif choice == '9':
                 self.handle_system_management()
@@ -559,15 +1958,127 @@ class SuperchargedRaceEngineer:
             
             input("\nPress Enter to continue...")
 
+def _plain(value):
+    """NumPy scalars to Python values and NaN to None, for JSON and CSV output"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+def _plain_rows(rows):
+    return [{key: _plain(value) for key, value in row.items()} for row in rows]
+
+def _load_report_session(live_timing, year, event, session):
+    live_timing.initialize_fastf1()
+    return live_timing.load_f1_session(year, event, session)
+
+def build_report(event, year, session, track):
+    """Timing, per-driver, sector and weather analyses for one session, without prompts"""
+    started = time.perf_counter()
+    weather = WeatherIntegration()
+    live_timing = LiveTimingIntegration()
+    
+    # Session and weather load side by side; progress messages go to stderr so stdout stays clean
+    with redirect_stdout(sys.stderr), ThreadPoolExecutor(max_workers=2) as pool:
+        weather_future = pool.submit(weather.get_track_weather, track)
+        loaded = pool.submit(_load_report_session, live_timing, year, event, session).result()
+        weather_info = weather_future.result()
+        timing = live_timing.get_live_timing_data()
+        drivers = []
+        for entry in timing:
+            analysis = live_timing.get_driver_analysis(entry['driver_name'])
+            sectors = analysis.pop('best_sector_times')
+            full_name = analysis.pop('driver_name')
+            drivers.append({'driver_name': entry['driver_name'], 'full_name': full_name, **analysis, **sectors})
+    
+    sectors = []
+    if loaded and live_timing.sector_times is not None:
+        best = live_timing.get_best_sectors()
+        deltas = live_timing.get_sector_deltas()
+        theoretical = live_timing.get_theoretical_best_laps()
+        for entry in timing:
+            row = live_timing.sector_rows.get(entry['driver'])
+            if row is None:
+                continue
+            known = not np.isnan(deltas[row]).all()
+            sectors.append({
+                'driver_name': entry['driver_name'],
+                'sector1': best[row, 0], 'sector2': best[row, 1], 'sector3': best[row, 2],
+                'theoretical_best': theoretical[row],
+                'delta1': deltas[row, 0], 'delta2': deltas[row, 1], 'delta3': deltas[row, 2],
+                'strongest_sector': int(np.nanargmin(deltas[row])) + 1 if known else None,
+            })
+    
+    return {
+        'meta': {
+            'event': event, 'year': year, 'session': session, 'track': track,
+            'simulated': not loaded,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_s': round(time.perf_counter() - started, 3),
+        },
+        'weather': {key: _plain(value) for key, value in weather_info.items()},
+        'timing': _plain_rows(timing),
+        'drivers': _plain_rows(drivers),
+        'sectors': _plain_rows(sectors),
+    }
+
+def write_report(report, fmt, output):
+    """JSON to a file or stdout ('-'), or one CSV per section in the `output` directory"""
+    if fmt == 'json':
+        out = sys.stdout if output == '-' else open(output, 'w', encoding='utf-8')
+        try:
+            json.dump(report, out, indent=2)
+            out.write('\n')
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        return
+    
+    os.makedirs(output, exist_ok=True)
+    sections = dict(report, meta=[report['meta']], weather=[report['weather']])
+    for name, rows in sections.items():
+        if not rows:
+            continue
+        with open(os.path.join(output, f'{name}.csv'), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+def run_report(args):
+    if args.format == 'csv' and args.output == '-':
+        sys.exit("CSV reports need --output DIR")
+    report = build_report(args.event, args.year, args.session, args.track)
+    if report['meta']['simulated'] and not args.allow_simulated:
+        sys.exit(f"Could not load {args.year} {args.event} {args.session} (use --allow-simulated to report anyway)")
+    write_report(report, args.format, args.output)
+    print(f"Report for {args.year} {args.event} {args.session}: {len(report['timing'])} drivers "
+          f"in {report['meta']['elapsed_s']}s", file=sys.stderr)
+    return report
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Supercharged AI race engineer")
+    parser.add_argument('--fast', action='store_true',
+                        help="skip cosmetic delays and show the menu while timing and weather load")
+    parser.add_argument('--no-delays', action='store_true',
+                        help="turn off the cosmetic pauses and typing effect (startup still waits for data)")
+    report = parser.add_argument_group("headless report")
+    report.add_argument('--report', action='store_true', help="write a report and exit instead of the menu")
+    report.add_argument('--event', default='Bahrain Grand Prix')
+    report.add_argument('--year', type=int, default=2024)
+    report.add_argument('--session', default='R')
+    report.add_argument('--track', default='bahrain', help="weather location")
+    report.add_argument('--format', choices=['json', 'csv'], default='json')
+    report.add_argument('--output', default='-', help="JSON file or CSV directory (default: JSON to stdout)")
+    report.add_argument('--allow-simulated', action='store_true',
+                        help="report simulated timing if the session can't be loaded instead of failing")
+    return parser.parse_args(argv)
+
 # Run the supercharged race engineer
 if __name__ == "__main__":
-    # First, install FastF1 if not already installed
-    try:
-        import fastf1
-    except ImportError:
-        print("📦 FastF1 not installed. Installing now...")
-        os.system("pip install fastf1")
-        print("✅ FastF1 installed successfully!")
-    
-    engineer = SuperchargedRaceEngineer()
-    engineer.run()
\ No newline at end of file
+    args = parse_args()
+    if args.report:
+        run_report(args)
+    else:
+        engineer = SuperchargedRaceEngineer(fast_start=args.fast, delays=False if args.no_delays else None)
+        engineer.run()
\ No newline at end of file
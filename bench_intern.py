@@ -0,0 +1,166 @@
+"""
+Benchmarks for the BasicBot order path in intern.py
+
+Benchmarks:
+- signing: per-order cost of building and signing the query string, comparing the
+  original urlencode + hmac.new path with encode_params + HmacSigner
+- orders: drives place_market_order / place_limit_order through AsyncBasicBot at
+  increasing concurrency against mock_futures_server.py (run in a separate
+  process so its CPU isn't counted) and reports orders/sec, p50/p99 latency and
+  bot CPU time per order
+
+Usage:
+    python bench_intern.py
+    python bench_intern.py signing --number 200000
+    python bench_intern.py orders --orders 500 --concurrency 1 4 16 64 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import hmac
+import hashlib
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+import timeit
+from urllib.parse import urlencode
+
+import numpy as np
+import requests
+
+from intern import AsyncBasicBot, BasicBot, HmacSigner, RateLimiter, encode_params, logger
+
+MOCK_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mock_futures_server.py')
+
+SECRET = "x" * 64
+ORDER_SHAPES = {
+    'MARKET': BasicBot._order_params('BTCUSDT', 'BUY', 'MARKET', 0.002),
+    'LIMIT': BasicBot._order_params('BTCUSDT', 'SELL', 'LIMIT', 0.002, 64123.5),
+}
+
+
+def _sign_original(params):
+    params = params.copy()
+    params['timestamp'] = 1700000000000
+    params['recvWindow'] = 5000
+    query_string = urlencode(params, doseq=True)
+    signature = hmac.new(SECRET.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest()
+    return query_string + f"&signature={signature}"
+
+
+def _sign_fast(params, signer=HmacSigner(SECRET)):
+    params = params.copy()
+    params['timestamp'] = 1700000000000
+    params['recvWindow'] = 5000
+    query_string = encode_params(params)
+    return query_string + f"&signature={signer.sign(query_string)}"
+
+
+def bench_signing(number):
+    print(f"{'ORDER':<8} {'ORIGINAL':>12} {'FAST':>12} {'SPEEDUP':>8}")
+    for name, params in ORDER_SHAPES.items():
+        assert _sign_original(params) == _sign_fast(params)
+        original = min(timeit.repeat(lambda: _sign_original(params), number=number, repeat=3)) / number
+        fast = min(timeit.repeat(lambda: _sign_fast(params), number=number, repeat=3)) / number
+        print(f"{name:<8} {original * 1e6:>10.2f}us {fast * 1e6:>10.2f}us {original / fast:>7.2f}x")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _start_mock_server(args):
+    port = _free_port()
+    cmd = [sys.executable, MOCK_SERVER, '--port', str(port), '--api-secret', SECRET,
+           '--latency-ms', str(args.latency_ms), '--jitter-ms', str(args.jitter_ms),
+           '--error-rate', str(args.error_rate)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{base_url}/fapi/v1/time", timeout=1)
+            return proc, base_url
+        except requests.ConnectionError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("mock server did not start")
+
+
+async def _drive(bot, order_type, count):
+    # Only `concurrency` orders are started at a time, so latency excludes time spent queued behind the bot
+    slots = asyncio.Semaphore(bot.concurrency)
+
+    async def one(i):
+        async with slots:
+            started = time.perf_counter()
+            try:
+                if order_type == 'MARKET':
+                    await bot.place_market_order('BTCUSDT', 'BUY', 0.01)
+                else:
+                    await bot.place_limit_order('BTCUSDT', 'BUY', 0.01, 60000 + i % 100)
+                return time.perf_counter() - started, True
+            except Exception:
+                return time.perf_counter() - started, False
+    return await asyncio.gather(*(one(i) for i in range(count)))
+
+
+async def _bench_level(base_url, order_type, count, concurrency):
+    # Exchange-sized limits would pace the run; the benchmark measures the bot itself
+    limiter = RateLimiter([('REQUEST_WEIGHT', '1M', 10 ** 9), ('ORDERS', '1M', 10 ** 9)])
+    async with AsyncBasicBot('bench-key', SECRET, base_url=base_url, concurrency=concurrency) as bot:
+        bot.bot.rate_limiter = limiter
+        await _drive(bot, order_type, min(count, concurrency))  # warm up connections and exchangeInfo
+        cpu, wall = time.process_time(), time.perf_counter()
+        results = await _drive(bot, order_type, count)
+        cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    latencies = np.array([latency for latency, ok in results if ok]) * 1000
+    failed = sum(1 for _, ok in results if not ok)
+    return {
+        'orders_per_s': count / wall,
+        'p50_ms': float(np.percentile(latencies, 50)) if latencies.size else float('nan'),
+        'p99_ms': float(np.percentile(latencies, 99)) if latencies.size else float('nan'),
+        'cpu_us_per_order': cpu / count * 1e6,
+        'failed': failed,
+    }
+
+
+def bench_orders(args):
+    logger.setLevel(logging.CRITICAL)
+    proc, base_url = _start_mock_server(args)
+    try:
+        print(f"{'TYPE':<7} {'CONC':>5} {'ORDERS/S':>10} {'P50':>10} {'P99':>10} {'CPU/ORDER':>11} {'FAILED':>7}")
+        for order_type in ('MARKET', 'LIMIT'):
+            for concurrency in args.concurrency:
+                r = asyncio.run(_bench_level(base_url, order_type, args.orders, concurrency))
+                print(f"{order_type:<7} {concurrency:>5} {r['orders_per_s']:>10.1f} {r['p50_ms']:>8.2f}ms "
+                      f"{r['p99_ms']:>8.2f}ms {r['cpu_us_per_order']:>9.0f}us {r['failed']:>7}")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BasicBot order-path benchmarks")
+    parser.add_argument('benchmark', nargs='?', default='signing', choices=['signing', 'orders'])
+    parser.add_argument('--number', type=int, default=50000, help="signing: iterations per timing run")
+    parser.add_argument('--orders', type=int, default=200, help="orders: orders per concurrency level")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64],
+                        help="orders: concurrency levels to run")
+    parser.add_argument('--latency-ms', type=float, default=5.0, help="orders: mock exchange latency")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="orders: mock exchange latency jitter")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="orders: mock exchange 503 rate")
+    args = parser.parse_args()
+
+    if args.benchmark == 'signing':
+        bench_signing(args.number)
+    elif args.benchmark == 'orders':
+        bench_orders(args)
+
+
+if __name__ == '__main__':
+    main()
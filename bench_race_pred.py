@@ -0,0 +1,86 @@
+"""
+Startup benchmark for Race pred2.py
+
+Each run happens in a fresh interpreter so module imports are cold. For every
+mode it reports:
+- import: time to import the module
+- menu: time from construction until welcome_sequence hands over to the menu
+- ready: time until background timing and weather loading has finished
+
+Modes:
+- normal: the original sequential startup with typing effects and pauses
+- fast: SuperchargedRaceEngineer(fast_start=True)
+
+Name prompts are answered automatically and the engineer's output is discarded.
+
+Usage:
+    python bench_race_pred.py
+    python bench_race_pred.py --modes fast --runs 5
+"""
+
+import argparse
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+RACE_PRED = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Race pred2.py')
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location('race_pred2', RACE_PRED)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure_startup(mode):
+    """Time one startup in this interpreter; returns seconds per phase"""
+    started = time.perf_counter()
+    module = _load_module()
+    imported = time.perf_counter()
+
+    builtins.input = lambda prompt='': 'bench'
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        engineer = module.SuperchargedRaceEngineer(fast_start=(mode == 'fast'))
+        engineer.welcome_sequence()
+        menu = time.perf_counter()
+        engineer.wait_until_ready()
+        ready = time.perf_counter()
+
+    return {'import': imported - started, 'menu': menu - imported, 'ready': ready - imported}
+
+
+def _run_child(mode):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Race pred2.py startup benchmark")
+    parser.add_argument('--modes', nargs='+', default=['normal', 'fast'], choices=['normal', 'fast'])
+    parser.add_argument('--runs', type=int, default=3, help="fresh interpreters per mode")
+    parser.add_argument('--child', choices=['normal', 'fast'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_startup(args.child)))
+        return
+
+    print(f"{'MODE':<8} {'IMPORT':>10} {'MENU':>10} {'READY':>10}")
+    for mode in args.modes:
+        runs = [_run_child(mode) for _ in range(args.runs)]
+        median = {phase: float(np.median([r[phase] for r in runs])) for phase in runs[0]}
+        print(f"{mode:<8} {median['import'] * 1000:>8.0f}ms {median['menu'] * 1000:>8.0f}ms "
+              f"{median['ready'] * 1000:>8.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
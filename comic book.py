@@ -5,6 +5,72 @@ from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# OpenCV releases the GIL, so a thread pool keeps every core busy without pickling images
+MAX_WORKERS = os.cpu_count() or 1
+MAX_IN_FLIGHT = MAX_WORKERS * 2  # images loaded or being processed at once
+
+def remove_text_from_image(image_path):
+    """Inpaint text-like regions of one image; returns None if it can't be read
+    
+    Module level so it can run on pool workers without touching the GUI.
+    """
+    # Load the image
+    img = cv2.imread(image_path)
+    if img is None:
+        return None
+    
+    # Create a copy of the original image
+    result = img.copy()
+    
+    # Convert to grayscale
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    
+    # Apply multiple methods to detect text regions
+    
+    # Method 1: Using morphological operations to find text-like regions
+    # Create a rectangular kernel for dilation
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+    
+    # Apply blackhat operation to find dark text on light background
+    blackhat = cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, kernel)
+    
+    # Apply threshold to get binary image
+    _, thresh = cv2.threshold(blackhat, 10, 255, cv2.THRESH_BINARY)
+    
+    # Dilate to connect text components
+    dilated = cv2.dilate(thresh, kernel, iterations=2)
+    
+    # Method 2: Using edge detection to find contours that might be text
+    edges = cv2.Canny(gray, 50, 150)
+    
+    # Combine both methods
+    combined = cv2.bitwise_or(dilated, edges)
+    
+    # Find contours in the combined mask
+    contours, _ = cv2.findContours(combined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    # Filter contours by area and aspect ratio to find text regions
+    text_contours = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        area = cv2.contourArea(contour)
+        
+        # Filter based on area and aspect ratio (text tends to be wider than tall)
+        if area > 50 and w > h and w < img.shape[1] * 0.8 and h < img.shape[0] * 0.8:
+            text_contours.append(contour)
+    
+    # If we found text contours, apply inpainting to remove them
+    if text_contours:
+        # Create a mask for the text regions
+        mask = np.zeros(gray.shape, np.uint8)
+        cv2.drawContours(mask, text_contours, -1, 255, -1)
+        
+        # Apply inpainting to remove text while preserving the background
+        result = cv2.inpaint(result, mask, 3, cv2.INPAINT_TELEA)
+    
+    return result
 
 class ComicTextRemover:
     def __init__(self, root):
@@ -191,20 +257,52 @@ class ComicTextRemover:
         thread.start()
     
     def process_images_thread(self):
+        # Runs off the GUI thread; every widget update is handed back via root.after
+        total = len(self.images)
+        self.completed = 0
+        self.root.after(0, self.start_progress, total)
+        
+        # Parallelism comes from the pool, so keep OpenCV from also spreading each image over every core
+        cv_threads = cv2.getNumThreads()
+        cv2.setNumThreads(1)
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                pending = {}
+                for i, image_path in enumerate(self.images):
+                    if len(pending) >= MAX_IN_FLIGHT:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        self.collect_results(pending, done)
+                    pending[pool.submit(remove_text_from_image, image_path)] = i
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    self.collect_results(pending, done)
+        finally:
+            cv2.setNumThreads(cv_threads)
+            # Always hand the buttons back, even if the pool itself failed
+            self.root.after(0, self.processing_complete)
+    
+    def collect_results(self, pending, done):
+        """Store finished images as they complete and report each one to the GUI"""
+        for future in done:
+            i = pending.pop(future)
+            try:
+                self.processed_images[i] = future.result()
+            except Exception:  # e.g. cv2.error, MemoryError or OSError on one page
+                self.processed_images[i] = None
+            self.completed += 1
+            self.root.after(0, self.image_processed, i, self.completed)
+    
+    def start_progress(self, total):
         self.progress['value'] = 0
-        self.progress['maximum'] = len(self.images)
-        
-        for i, image_path in enumerate(self.images):
-            self.status_label.config(text=f"Processing image {i+1} of {len(self.images)}...")
-            
-            # Process the image
-            processed_img = self.remove_text_from_image(image_path)
-            self.processed_images[i] = processed_img
-            
-            # Update progress
-            self.progress['value'] = i + 1
-            self.root.update_idletasks()
-        
+        self.progress['maximum'] = total
+        self.status_label.config(text=f"Processing {total} images on {MAX_WORKERS} workers...")
+    
+    def image_processed(self, index, completed):
+        self.progress['value'] = completed
+        self.status_label.config(
+            text=f"Processed {completed} of {len(self.images)}: {os.path.basename(self.images[index])}")
+    
+    def processing_complete(self):
         # Re-enable buttons
         self.prev_btn.config(state=tk.NORMAL)
         self.next_btn.config(state=tk.NORMAL)
@@ -215,65 +313,16 @@ class ComicTextRemover:
         self.current_index = 0
         self.display_processed_image()
         
-        self.status_label.config(text=f"Processing complete! {len(self.images)} images processed.")
-        messagebox.showinfo("Success", f"All {len(self.images)} images have been processed successfully!")
+        processed = sum(1 for img in self.processed_images if img is not None)
+        self.status_label.config(text=f"Processing complete! {processed} images processed.")
+        if processed == len(self.images):
+            messagebox.showinfo("Success", f"All {len(self.images)} images have been processed successfully!")
+        else:
+            messagebox.showwarning("Warning", f"{processed} of {len(self.images)} images processed; "
+                                              f"{len(self.images) - processed} could not be read.")
     
     def remove_text_from_image(self, image_path):
-        # Load the image
-        img = cv2.imread(image_path)
-        if img is None:
-            return None
-        
-        # Create a copy of the original image
-        result = img.copy()
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
-        # Apply multiple methods to detect text regions
-        
-        # Method 1: Using morphological operations to find text-like regions
-        # Create a rectangular kernel for dilation
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        
-        # Apply blackhat operation to find dark text on light background
-        blackhat = cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, kernel)
-        
-        # Apply threshold to get binary image
-        _, thresh = cv2.threshold(blackhat, 10, 255, cv2.THRESH_BINARY)
-        
-        # Dilate to connect text components
-        dilated = cv2.dilate(thresh, kernel, iterations=2)
-        
-        # Method 2: Using edge detection to find contours that might be text
-        edges = cv2.Canny(gray, 50, 150)
-        
-        # Combine both methods
-        combined = cv2.bitwise_or(dilated, edges)
-        
-        # Find contours in the combined mask
-        contours, _ = cv2.findContours(combined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        # Filter contours by area and aspect ratio to find text regions
-        text_contours = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            area = cv2.contourArea(contour)
-            
-            # Filter based on area and aspect ratio (text tends to be wider than tall)
-            if area > 50 and w > h and w < img.shape[1] * 0.8 and h < img.shape[0] * 0.8:
-                text_contours.append(contour)
-        
-        # If we found text contours, apply inpainting to remove them
-        if text_contours:
-            # Create a mask for the text regions
-            mask = np.zeros(gray.shape, np.uint8)
-            cv2.drawContours(mask, text_contours, -1, 255, -1)
-            
-            # Apply inpainting to remove text while preserving the background
-            result = cv2.inpaint(result, mask, 3, cv2.INPAINT_TELEA)
-        
-        return result
+        return remove_text_from_image(image_path)
     
     def display_processed_image(self):
         if (self.processed_images and 
@@ -6,46 +6,243 @@ Features:
 - Support BUY and SELL sides
 - Interactive CLI menu (simple UI enhancement)
 - REST calls directly to https://testnet.binancefuture.com
-- Logging of API requests, responses, and errors
+- Logging of API requests, responses, and errors (background writer, JSON lines, rotation)
+- AsyncBasicBot for sending bursts of orders concurrently over a pooled session
+- Batch order placement via /fapi/v1/batchOrders with automatic chunking
+- Client-side request-weight / order-count rate limiting driven by X-MBX-* headers
+- Request timestamps from a monotonic clock corrected by a smoothed server-time offset
+- WebSocket depth and user-data streams feeding a local order book and balance/position cache
+- Local tick size / lot size / min-notional checks from cached exchangeInfo filters
+- Automatic retries with jittered backoff, idempotent client order IDs and a circuit breaker
+- Headless batch mode: stream orders from CSV / JSON lines through the bot concurrently
 
 Usage:
     python binance_futures_bot.py
+
+    # Headless: API keys from BINANCE_API_KEY / BINANCE_API_SECRET
+    python binance_futures_bot.py --orders orders.csv --concurrency 20 --output results.jsonl
+    cat orders.jsonl | python binance_futures_bot.py --orders - --format jsonl
 """
 
 import time
 import hmac
 import hashlib
+import json
+import re
+import asyncio
 import requests
 import logging
+import numpy as np
+import os
 import sys
-from urllib.parse import urlencode
+import csv
+import argparse
+import queue
+import random
+import atexit
+import threading
+import uuid
+import logging.handlers
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, quote_plus
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
 
 # ---------- Configuration ----------
 DEFAULT_TESTNET_BASE = "https://testnet.binancefuture.com"
+DEFAULT_TESTNET_WS = "wss://stream.binancefuture.com"
 BOT_LOGFILE = "bot.log"
 REQUESTS_LOGFILE = "requests.log"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONCURRENCY = 10
+MAX_BATCH_ORDERS = 5  # Exchange limit for /fapi/v1/batchOrders
+
+# USDT-M futures limits: (type, interval, limit). Interval uses the exchange's header suffix format.
+DEFAULT_RATE_LIMITS = [
+    ('REQUEST_WEIGHT', '1M', 2400),
+    ('ORDERS', '1M', 1200),
+    ('ORDERS', '10S', 300),
+]
+RATE_LIMIT_HEADROOM = 0.9  # Only use this fraction of each limit to leave room for clock skew
+CLOCK_SYNC_INTERVAL = 60  # seconds between server time samples
+CLOCK_SYNC_SMOOTHING = 0.2  # weight of each new offset sample in the running average
+DEPTH_SNAPSHOT_LIMIT = 1000
+LISTEN_KEY_KEEPALIVE = 30 * 60  # seconds; listen keys expire after 60 minutes without a keepalive
+STREAM_RECONNECT_MAX_DELAY = 30  # seconds
+EXCHANGE_INFO_TTL = 15 * 60  # seconds
+EXCHANGE_INFO_RETRY_AFTER = 30  # seconds a failed exchangeInfo fetch is remembered before trying again
+REQUEST_TIMEOUT = 10  # seconds
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.2  # seconds, doubled on every attempt
+RETRY_MAX_DELAY = 5.0  # seconds
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive transient failures before the circuit opens
+CIRCUIT_RESET_TIMEOUT = 30  # seconds the circuit stays open before a trial request
+DUPLICATE_CLIENT_ORDER_ID = -4116
+ORDER_DOES_NOT_EXIST = -2013
 
 # ---------- Logging Setup ----------
-logger = logging.getLogger("BasicBot")
-logger.setLevel(logging.DEBUG)
+# Handlers are fed from a queue by a background writer thread, so log I/O never
+# runs on the order path. File output is written in batches and rotated by size and age.
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_ROTATE_INTERVAL = 24 * 3600  # seconds
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.5  # seconds
+REQUEST_LOG_BODY_LIMIT = 2000  # characters of response body kept per request, None for all
+REQUEST_LOG_SAMPLE_RATE = 1.0  # fraction of successful requests whose bodies are logged
+
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
-fh = logging.FileHandler(BOT_LOGFILE)
-fh.setLevel(logging.INFO)
-fh.setFormatter(formatter)
-logger.addHandler(fh)
 
-ch = logging.StreamHandler()
-ch.setLevel(logging.INFO)
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line, including any structured fields passed via `extra`."""
+
+    _RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self._RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class BatchRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that also rolls over on age and can write many records at once."""
+
+    def __init__(self, filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                 rotate_interval=LOG_ROTATE_INTERVAL, encoding='utf-8'):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self.rotate_interval = rotate_interval
+        self.rollover_at = time.time() + rotate_interval if rotate_interval else None
+
+    def _should_roll(self, size):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        if self.maxBytes > 0 and self.stream is not None:
+            return self.stream.tell() + size >= self.maxBytes
+        return False
+
+    def doRollover(self):
+        super().doRollover()
+        if self.rotate_interval:
+            self.rollover_at = time.time() + self.rotate_interval
+
+    def emit_batch(self, records):
+        records = [r for r in records if r.levelno >= self.level]
+        if not records:
+            return
+        self.acquire()
+        try:
+            data = ''.join(self.format(r) + self.terminator for r in records)
+            if self.stream is None:
+                self.stream = self._open()
+            if self._should_roll(len(data)):
+                self.doRollover()
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            self.handleError(records[0])
+        finally:
+            self.release()
+
+
+class BackgroundLogWriter:
+    """Drains a logging queue on a daemon thread and hands records to the real handlers in batches."""
 
-req_logger = logging.getLogger("requests_logger")
-req_logger.setLevel(logging.DEBUG)
-rfh = logging.FileHandler(REQUESTS_LOGFILE)
-rfh.setLevel(logging.DEBUG)
-rfh.setFormatter(formatter)
-req_logger.addHandler(rfh)
+    def __init__(self, log_queue, handlers, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stop = object()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='BackgroundLogWriter', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self.queue.put(self._stop)
+            self._thread.join()
+            self._thread = None
+            for handler in self.handlers:
+                handler.close()
+
+    def _write(self, batch):
+        for handler in self.handlers:
+            if isinstance(handler, BatchRotatingFileHandler):
+                handler.emit_batch(batch)
+            else:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is self._stop
+            if stopping:
+                batch.pop()
+            if batch:
+                self._write(batch)
+            if stopping:
+                return
+
+
+def _queue_logger(name, handlers, json_lines, batch_size, flush_interval):
+    log = logging.getLogger(name)
+    log.setLevel(logging.DEBUG)
+    for handler in handlers:
+        if json_lines and isinstance(handler, logging.FileHandler):
+            handler.setFormatter(JsonLinesFormatter())
+        else:
+            handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    log.handlers = [logging.handlers.QueueHandler(log_queue)]
+    writer = BackgroundLogWriter(log_queue, handlers, batch_size, flush_interval)
+    writer.start()
+    atexit.register(writer.stop)
+    return log
+
+
+def setup_logging(bot_logfile=BOT_LOGFILE, requests_logfile=REQUESTS_LOGFILE, json_lines=True,
+                  max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT, rotate_interval=LOG_ROTATE_INTERVAL,
+                  batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL):
+    fh = BatchRotatingFileHandler(bot_logfile, max_bytes, backup_count, rotate_interval)
+    fh.setLevel(logging.INFO)
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
+    bot_log = _queue_logger("BasicBot", [fh, ch], json_lines, batch_size, flush_interval)
+
+    rfh = BatchRotatingFileHandler(requests_logfile, max_bytes, backup_count, rotate_interval)
+    rfh.setLevel(logging.DEBUG)
+    request_log = _queue_logger("requests_logger", [rfh], json_lines, batch_size, flush_interval)
+    return bot_log, request_log
+
+
+logger, req_logger = setup_logging()
 
 
 # ---------- Utilities ----------
@@ -57,108 +254,1405 @@ def _sign(query_string: str, secret: str) -> str:
     return hmac.new(secret.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest()
 
 
+class HmacSigner:
+    """HMAC-SHA256 signer that keys the hash once and copies that state for every request."""
+
+    def __init__(self, secret: str):
+        self._keyed = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def sign(self, query_string: str) -> str:
+        h = self._keyed.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+
+
+# Characters quote_plus leaves untouched; order params (symbols, sides, numbers) are almost always made of these
+_is_url_safe = re.compile(r'[A-Za-z0-9_.\-~]*').fullmatch
+
+
+def encode_params(params: dict) -> str:
+    """Produce the same query string as urlencode(params, doseq=True), skipping quoting for plain values."""
+    parts = []
+    for key, value in params.items():
+        if isinstance(value, (list, tuple)):
+            return urlencode(params, doseq=True)
+        value = value if isinstance(value, str) else str(value)
+        parts.append(f"{key}={value if _is_url_safe(value) else quote_plus(value)}")
+    return '&'.join(parts)
+
+
+def new_client_order_id() -> str:
+    """Unique newClientOrderId; reusing it on retries lets the exchange drop duplicate orders."""
+    return f"bb-{uuid.uuid4().hex[:24]}"
+
+
+def _interval_seconds(interval: str) -> float:
+    """Convert an exchange interval such as '1M' or '10S' to seconds."""
+    units = {'S': 1, 'M': 60, 'H': 3600, 'D': 86400}
+    interval = interval.upper()
+    return int(interval[:-1]) * units[interval[-1]]
+
+
+# ---------- Errors ----------
+class BinanceAPIError(Exception):
+    def __init__(self, status: int, body: str):
+        super().__init__(f"API error: {status} - {body}")
+        self.status = status
+        self.body = body
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = {}
+        self.code = payload.get('code') if isinstance(payload, dict) else None
+        self.msg = payload.get('msg') if isinstance(payload, dict) else None
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+# ---------- Order Validation ----------
+class OrderValidationError(ValueError):
+    pass
+
+
+def _step_decimals(step: str) -> int:
+    """Number of decimals in an exchange step string, e.g. '0.00100000' -> 3."""
+    step = step.rstrip('0')
+    return len(step.split('.')[1]) if '.' in step else 0
+
+
+class SymbolFilters:
+    """exchangeInfo trading filters, fetched once and cached for `ttl` seconds.
+
+    A failed fetch is cached too, for `retry_after` seconds, so an outage doesn't
+    put a full retry and backoff cycle in front of every order.
+    """
+
+    def __init__(self, fetch_exchange_info, ttl: float = EXCHANGE_INFO_TTL,
+                 retry_after: float = EXCHANGE_INFO_RETRY_AFTER):
+        self.fetch_exchange_info = fetch_exchange_info
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._filters = {}
+        self._loaded_at = None
+        self._failed_at = None
+        self._failure = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def _parse_symbol(info):
+        raw = {f['filterType']: f for f in info['filters']}
+        price = raw.get('PRICE_FILTER', {})
+        lot = raw.get('LOT_SIZE', {})
+        market_lot = raw.get('MARKET_LOT_SIZE', lot)
+        return {
+            'tick_size': float(price.get('tickSize', 0)),
+            'price_decimals': _step_decimals(price.get('tickSize', '0')),
+            'min_price': float(price.get('minPrice', 0)),
+            'max_price': float(price.get('maxPrice', 0)),
+            'step_size': float(lot.get('stepSize', 0)),
+            'qty_decimals': _step_decimals(lot.get('stepSize', '0')),
+            'min_qty': float(lot.get('minQty', 0)),
+            'max_qty': float(lot.get('maxQty', 0)),
+            'market_step_size': float(market_lot.get('stepSize', 0)),
+            'market_qty_decimals': _step_decimals(market_lot.get('stepSize', '0')),
+            'market_min_qty': float(market_lot.get('minQty', 0)),
+            'market_max_qty': float(market_lot.get('maxQty', 0)),
+            'min_notional': float(raw.get('MIN_NOTIONAL', {}).get('notional', 0)),
+        }
+
+    def refresh(self):
+        try:
+            info = self.fetch_exchange_info()
+        except Exception as e:
+            with self._lock:
+                self._failed_at = time.monotonic()
+                self._failure = e
+            raise
+        filters = {s['symbol']: self._parse_symbol(s) for s in info['symbols']}
+        with self._lock:
+            self._filters = filters
+            self._loaded_at = time.monotonic()
+            self._failed_at = self._failure = None
+        logger.info(f"Loaded trading filters for {len(filters)} symbols")
+
+    def _expired(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def get(self, symbol: str):
+        if self._expired():
+            # Concurrent callers wait for a single refresh instead of each fetching exchangeInfo
+            with self._refresh_lock:
+                if self._expired():
+                    if self._failed_at is not None:
+                        wait_for = self.retry_after - (time.monotonic() - self._failed_at)
+                        if wait_for > 0:
+                            raise RuntimeError(f"exchangeInfo unavailable, next attempt in {wait_for:.0f}s: "
+                                               f"{self._failure}")
+                    self.refresh()
+        filters = self._filters.get(symbol.upper())
+        if filters is None:
+            raise OrderValidationError(f"Unknown symbol: {symbol.upper()}")
+        return filters
+
+
+def _snap(values, step, decimals, rounding):
+    if step <= 0:
+        return values
+    # The small epsilon keeps values that are already on the grid from flooring one step down
+    nudge = 1e-9 if rounding is np.floor else 0.0
+    return np.round(rounding(values / step + nudge) * step, decimals)
+
+
+def validate_order_batch(filters, quantities, prices=None, market: bool = False, reduce_only=False):
+    """Snap a batch of orders for one symbol to its filters and check them.
+
+    Quantities are floored to the lot step and prices rounded to the tick size.
+    Returns (quantities, prices, errors) where errors holds a message per order
+    that would be rejected by the exchange, or None for valid orders.
+    """
+    prefix = 'market_' if market else ''
+    qty = _snap(np.asarray(quantities, dtype=np.float64), filters[prefix + 'step_size'],
+                filters[prefix + 'qty_decimals'], np.floor)
+    min_qty, max_qty = filters[prefix + 'min_qty'], filters[prefix + 'max_qty']
+    checks = [
+        (qty < min_qty, f"quantity below minQty {min_qty}"),
+        (qty <= 0, "quantity must be positive"),
+        (qty > max_qty if max_qty > 0 else np.zeros(qty.shape, bool), f"quantity above maxQty {max_qty}"),
+    ]
+    price = None
+    if prices is not None:
+        price = _snap(np.asarray(prices, dtype=np.float64), filters['tick_size'], filters['price_decimals'], np.round)
+        min_price, max_price, min_notional = filters['min_price'], filters['max_price'], filters['min_notional']
+        reduce_only = np.broadcast_to(np.asarray(reduce_only, dtype=bool), qty.shape)
+        checks += [
+            (price < min_price, f"price below minPrice {min_price}"),
+            (price <= 0, "price must be positive"),
+            (price > max_price if max_price > 0 else np.zeros(qty.shape, bool), f"price above maxPrice {max_price}"),
+            # Reduce-only orders are exempt from the minimum notional
+            ((price * qty < min_notional) & ~reduce_only, f"notional below minimum {min_notional}"),
+        ]
+    errors = np.full(qty.shape, None, dtype=object)
+    # Earlier checks take precedence, so apply them last
+    for failed, message in reversed(checks):
+        errors[failed] = message
+    return qty, price, errors
+
+
+# ---------- Clock Sync ----------
+class ClockSync:
+    """Keeps a smoothed offset between the local clock and the exchange's clock.
+
+    fetch_server_ms is any callable returning the server time in milliseconds. It is
+    sampled periodically on a background thread; now_ms() itself never touches the
+    network and advances with time.monotonic, so wall-clock jumps don't affect it.
+    """
+
+    def __init__(self, fetch_server_ms, interval: float = CLOCK_SYNC_INTERVAL, alpha: float = CLOCK_SYNC_SMOOTHING,
+                 clock=time.monotonic):
+        self.fetch_server_ms = fetch_server_ms
+        self.interval = interval
+        self.alpha = alpha
+        self._clock = clock
+        self._mono_anchor = clock()
+        self._wall_anchor_ms = _now_ms()
+        self.offset_ms = 0.0
+        self.last_rtt_ms = None
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _local_ms(self, mono=None):
+        mono = self._clock() if mono is None else mono
+        return self._wall_anchor_ms + (mono - self._mono_anchor) * 1000
+
+    def now_ms(self) -> int:
+        return int(self._local_ms() + self.offset_ms)
+
+    def sync(self) -> float:
+        """Take one server time sample and fold it into the offset. Returns the new offset in ms."""
+        sent = self._clock()
+        server_ms = self.fetch_server_ms()
+        received = self._clock()
+        # Assume the server stamped its reply halfway through the round trip
+        sample = server_ms - self._local_ms((sent + received) / 2)
+        self.last_rtt_ms = (received - sent) * 1000
+        if self.samples == 0:
+            self.offset_ms = sample
+        else:
+            self.offset_ms += self.alpha * (sample - self.offset_ms)
+        self.samples += 1
+        logger.debug(f"Clock sync: offset {self.offset_ms:.1f}ms (sample {sample:.1f}ms, rtt {self.last_rtt_ms:.1f}ms)")
+        return self.offset_ms
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """Sync now, then keep re-syncing every `interval` seconds on a daemon thread.
+
+        Does nothing if already running. A failed first sample is logged and the
+        local clock is used until the background thread gets a sample through.
+        """
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Could not sync with server time, using local clock: {e}")
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='ClockSync', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._start_lock:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Clock sync failed: {e}")
+
+
+# ---------- Retries & Circuit Breaker ----------
+class RetryPolicy:
+    def __init__(self, max_retries: int = MAX_RETRIES, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter exponential backoff for the given retry number (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+
+class CircuitBreaker:
+    """Fails fast after repeated transient failures instead of piling more requests onto a degraded endpoint.
+
+    closed -> open after `failure_threshold` consecutive failures; after `reset_timeout`
+    seconds one trial request is let through (half_open) and its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_count = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                logger.info("Circuit half-open, sending a trial request")
+                return
+            if self.state != 'closed':
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit {self.state}: exchange API degraded, not sending request")
+
+    def record_success(self):
+        with self._lock:
+            if self.state != 'closed':
+                logger.info("Circuit closed")
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or (self.state == 'closed' and self.failures >= self.failure_threshold):
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self.opened_count += 1
+                logger.error(f"Circuit opened after {self.failures} consecutive failures")
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'times_opened': self.opened_count,
+                'rejected_requests': self.rejected,
+            }
+
+
+# ---------- Rate Limiting ----------
+class _TokenBucket:
+    def __init__(self, kind: str, interval: str, limit: int, headroom: float):
+        self.kind = kind
+        self.interval = interval.upper()
+        self.capacity = max(1, int(limit * headroom))
+        self.rate = self.capacity / _interval_seconds(interval)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, cost: int) -> float:
+        """Take cost tokens (the balance may go negative) and return how long to wait for them."""
+        self.tokens -= cost
+        return max(0.0, -self.tokens / self.rate)
+
+    def observe_used(self, used: int):
+        # The exchange counts per fixed window; trust it only when it says we used more than we think
+        server_tokens = self.capacity - used
+        if server_tokens < self.tokens:
+            self.tokens = float(server_tokens)
+
+
+class RateLimiter:
+    """Token-bucket scheduler for request weight and order counts.
+
+    Callers reserve capacity before each request and are told how long to wait, so
+    bursts are paced in arrival order instead of running into HTTP 429/418. Response
+    headers (X-MBX-USED-WEIGHT-*, X-MBX-ORDER-COUNT-*) correct the local estimate.
+    """
+
+    def __init__(self, limits=None, headroom: float = RATE_LIMIT_HEADROOM):
+        self._lock = threading.Lock()
+        self._buckets = [_TokenBucket(kind, interval, limit, headroom)
+                         for kind, interval, limit in (limits or DEFAULT_RATE_LIMITS)]
+        self._blocked_until = 0.0
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self, weight: int = 1, orders: int = 0) -> float:
+        """Reserve capacity for one request and return the number of seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._blocked_until - now)
+            for bucket in self._buckets:
+                bucket.refill(now)
+                cost = weight if bucket.kind == 'REQUEST_WEIGHT' else orders
+                if cost:
+                    delay = max(delay, bucket.reserve(cost))
+            self.requests += 1
+            if delay > 0:
+                self.delayed += 1
+                self.total_wait += delay
+                self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    def acquire(self, weight: int = 1, orders: int = 0) -> float:
+        """Blocking version of reserve(): sleeps until the request may be sent."""
+        delay = self.reserve(weight, orders)
+        if delay > 0:
+            logger.debug(f"Rate limiter delaying request by {delay:.3f}s")
+            time.sleep(delay)
+        return delay
+
+    def update_from_headers(self, headers):
+        with self._lock:
+            now = time.monotonic()
+            for name, value in headers.items():
+                name = name.upper()
+                if name.startswith('X-MBX-USED-WEIGHT-'):
+                    kind, interval = 'REQUEST_WEIGHT', name[len('X-MBX-USED-WEIGHT-'):]
+                elif name.startswith('X-MBX-ORDER-COUNT-'):
+                    kind, interval = 'ORDERS', name[len('X-MBX-ORDER-COUNT-'):]
+                else:
+                    continue
+                for bucket in self._buckets:
+                    if bucket.kind == kind and bucket.interval == interval:
+                        bucket.refill(now)
+                        bucket.observe_used(int(value))
+
+    def block_for(self, seconds: float):
+        """Hold back every request for the given time, e.g. after a 429/418 with Retry-After."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'delayed_requests': self.delayed,
+                'total_wait_s': round(self.total_wait, 6),
+                'avg_wait_s': round(self.total_wait / self.requests, 6) if self.requests else 0.0,
+                'max_wait_s': round(self.max_wait, 6),
+            }
+
+
 # ---------- BasicBot Class ----------
 class BasicBot:
-    def __init__(self, api_key: str, api_secret: str, base_url: str = DEFAULT_TESTNET_BASE, recv_window: int = 5000):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = DEFAULT_TESTNET_BASE, recv_window: int = 5000,
+                 pool_size: int = DEFAULT_POOL_SIZE, rate_limiter: RateLimiter = None, validate_orders: bool = True,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url.rstrip('/')
         self.recv_window = recv_window
         self.session = requests.Session()
+        # Keep up to pool_size keep-alive connections so concurrent callers don't reconnect
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.signer = HmacSigner(api_secret)
+        self.clock = ClockSync(self.get_server_time)
+        self.filters = SymbolFilters(self.get_exchange_info) if validate_orders else None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit = circuit_breaker or CircuitBreaker()
+        self.retries = 0
+        self.recovered_duplicates = 0
         self.session.headers.update({
             'X-MBX-APIKEY': self.api_key,
             'Content-Type': 'application/x-www-form-urlencoded'
         })
         logger.info(f"Initialized BasicBot with base URL: {self.base_url}")
 
-    def _log_request(self, method, path, params, resp):
+    def _log_request(self, method, path, params, resp, elapsed):
+        if not req_logger.isEnabledFor(logging.DEBUG):
+            return
         try:
-            req_logger.debug(f"REQUEST -> {method} {path} | params: {params}")
-            req_logger.debug(f"RESPONSE <- status: {resp.status_code} | body: {resp.text}")
+            ok = resp.status_code in (200, 201)
+            # Errors always keep their body; successful bodies are sampled and truncated
+            if ok and random.random() >= REQUEST_LOG_SAMPLE_RATE:
+                body = None
+            else:
+                body = resp.text
+                if REQUEST_LOG_BODY_LIMIT is not None and len(body) > REQUEST_LOG_BODY_LIMIT:
+                    body = body[:REQUEST_LOG_BODY_LIMIT] + '...'
+            req_logger.debug(f"{method} {path.split('?', 1)[0]} -> {resp.status_code}", extra={
+                'method': method, 'path': path, 'params': params, 'status': resp.status_code,
+                'elapsed_ms': round(elapsed * 1000, 3), 'body': body})
         except Exception as e:
             logger.error(f"Failed to write request log: {e}")
 
-    def _signed_request(self, method: str, path: str, params: dict):
-        params = params.copy() if params else {}
-        params['timestamp'] = _now_ms()
-        params['recvWindow'] = self.recv_window
-        query_string = urlencode(params, doseq=True)
-        signature = _sign(query_string, self.api_secret)
-        query_string += f"&signature={signature}"
-        url = f"{self.base_url}{path}?{query_string}"
+    def _send(self, method: str, path: str, url: str, params: dict, expected_codes=()):
+        """Send one request; error codes in expected_codes are still raised but only logged at DEBUG."""
+        started = time.perf_counter()
         try:
             if method.upper() == 'POST':
-                resp = self.session.post(url)
+                resp = self.session.post(url, timeout=REQUEST_TIMEOUT)
             elif method.upper() == 'GET':
-                resp = self.session.get(url)
+                resp = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            elif method.upper() == 'PUT':
+                resp = self.session.put(url, timeout=REQUEST_TIMEOUT)
             elif method.upper() == 'DELETE':
-                resp = self.session.delete(url)
+                resp = self.session.delete(url, timeout=REQUEST_TIMEOUT)
             else:
                 raise ValueError('Unsupported HTTP method')
         except requests.RequestException as e:
-            logger.exception(f"HTTP request failed: {e}")
+            logger.error(f"HTTP request failed: {e}")
             raise
-        self._log_request(method, url, params, resp)
+        self._log_request(method, url, params, resp, time.perf_counter() - started)
+        self.rate_limiter.update_from_headers(resp.headers)
+        if resp.status_code in (418, 429):
+            retry_after = float(resp.headers.get('Retry-After') or 60)
+            logger.warning(f"Rate limited by exchange ({resp.status_code}), backing off for {retry_after}s")
+            self.rate_limiter.block_for(retry_after)
         if resp.status_code not in (200, 201):
-            logger.error(f"Non-success status code: {resp.status_code} | body: {resp.text}")
-            raise Exception(f"API error: {resp.status_code} - {resp.text}")
+            error = BinanceAPIError(resp.status_code, resp.text)
+            log = logger.debug if error.code in expected_codes else logger.error
+            log(f"Non-success status code: {resp.status_code} | body: {resp.text}")
+            if error.code == -1021:
+                # Timestamp outside recvWindow: our offset is stale, refresh it for the next request
+                try:
+                    self.clock.sync()
+                except Exception as e:
+                    logger.warning(f"Clock sync failed: {e}")
+            raise error
         return resp.json()
 
+    @staticmethod
+    def _is_endpoint_failure(error):
+        """Network errors and 5xx mean the endpoint is degraded; these count towards the circuit breaker."""
+        if isinstance(error, requests.RequestException):
+            return True
+        return isinstance(error, BinanceAPIError) and error.status >= 500
+
+    def _is_retryable(self, error):
+        if self._is_endpoint_failure(error):
+            return True
+        # 429 waits out Retry-After in the rate limiter; -1021 is retried with a freshly synced clock
+        return isinstance(error, BinanceAPIError) and (error.status == 429 or error.code == -1021)
+
+    def _with_retries(self, method: str, path: str, attempt, reconcile=None):
+        """Run attempt() with retries for transient failures, guarded by the circuit breaker.
+
+        A timeout, dropped connection or 5xx may still have reached the exchange, and
+        newClientOrderId is only unique among open orders, so order placement passes
+        reconcile(). It runs before every such resend and returns the result if the
+        request went through, or None once the exchange confirms it did not. If that
+        cannot be confirmed, the original error is raised instead of resending.
+        """
+        retry = 0
+        while True:
+            self.circuit.before_call()
+            try:
+                result = attempt()
+            except Exception as e:
+                if self._is_endpoint_failure(e):
+                    self.circuit.record_failure()
+                else:
+                    self.circuit.record_success()
+                if not self._is_retryable(e) or retry >= self.retry_policy.max_retries:
+                    raise
+                retry += 1
+                self.retries += 1
+                delay = self.retry_policy.backoff(retry)
+                logger.warning(f"{method} {path} failed ({e}); retry {retry}/{self.retry_policy.max_retries} in {delay:.2f}s")
+                time.sleep(delay)
+                if reconcile is not None and self._is_endpoint_failure(e):
+                    try:
+                        result = reconcile()
+                    except Exception as lookup_error:
+                        logger.error(f"Could not confirm whether {method} {path} went through "
+                                     f"({lookup_error}); not resending")
+                        raise e from lookup_error
+                    if result is not None:
+                        return result
+            else:
+                self.circuit.record_success()
+                return result
+
+    def _signed_request(self, method: str, path: str, params: dict, weight: int = 1, orders=0,
+                        reconcile=None, expected_codes=()):
+        # orders may be a callable when reconcile() can shrink what the next attempt sends
+        # Server time is sampled before the first signed request, however the bot is used
+        if not self.clock.running:
+            self.clock.start()
+
+        def attempt():
+            # Re-signed on every attempt so each retry carries a fresh timestamp
+            self.rate_limiter.acquire(weight, orders() if callable(orders) else orders)
+            signed = params.copy() if params else {}
+            signed['timestamp'] = self.clock.now_ms()
+            signed['recvWindow'] = self.recv_window
+            query_string = encode_params(signed)
+            query_string += f"&signature={self.signer.sign(query_string)}"
+            url = f"{self.base_url}{path}?{query_string}"
+            return self._send(method, path, url, signed, expected_codes)
+        return self._with_retries(method, path, attempt, reconcile)
+
+    def _public_request(self, method: str, path: str, params: dict = None, weight: int = 1):
+        params = params or {}
+        url = f"{self.base_url}{path}"
+        if params:
+            url += f"?{encode_params(params)}"
+
+        def attempt():
+            self.rate_limiter.acquire(weight)
+            return self._send(method, path, url, params)
+        return self._with_retries(method, path, attempt)
+
+    def get_server_time(self) -> int:
+        return self._public_request('GET', '/fapi/v1/time')['serverTime']
+
+    def get_order(self, symbol: str, order_id: int = None, client_order_id: str = None):
+        params = {'symbol': symbol.upper()}
+        if order_id is not None:
+            params['orderId'] = order_id
+        if client_order_id is not None:
+            params['origClientOrderId'] = client_order_id
+        return self._signed_request('GET', '/fapi/v1/order', params)
+
+    def get_exchange_info(self):
+        return self._public_request('GET', '/fapi/v1/exchangeInfo')
+
+    def get_depth_snapshot(self, symbol: str, limit: int = DEPTH_SNAPSHOT_LIMIT):
+        weight = 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+        return self._public_request('GET', '/fapi/v1/depth', {'symbol': symbol.upper(), 'limit': limit}, weight=weight)
+
+    def create_listen_key(self) -> str:
+        return self._public_request('POST', '/fapi/v1/listenKey')['listenKey']
+
+    def keepalive_listen_key(self):
+        return self._public_request('PUT', '/fapi/v1/listenKey')
+
     def get_account_balance(self):
         path = '/fapi/v2/balance'
         logger.info("Querying account balance")
-        return self._signed_request('GET', path, {})
+        return self._signed_request('GET', path, {}, weight=5)
 
-    def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False):
-        path = '/fapi/v1/order'
+    @staticmethod
+    def _order_params(symbol: str, side: str, order_type: str, quantity: float, price: float = None,
+                      timeInForce: str = 'GTC', reduce_only: bool = False, client_order_id: str = None):
         params = {
             'symbol': symbol.upper(),
             'side': side.upper(),
-            'type': 'MARKET',
-            'quantity': quantity,
-            'reduceOnly': str(reduce_only).lower()
+            'type': order_type.upper(),
         }
-        logger.info(f"Placing MARKET order: {side} {quantity} {symbol}")
-        return self._signed_request('POST', path, params)
+        if params['type'] == 'LIMIT':
+            params['timeInForce'] = timeInForce
+        params['quantity'] = quantity
+        if params['type'] == 'LIMIT':
+            params['price'] = price
+        params['reduceOnly'] = str(reduce_only).lower()
+        params['newClientOrderId'] = client_order_id or new_client_order_id()
+        return params
 
-    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, timeInForce: str = 'GTC', reduce_only: bool = False):
-        path = '/fapi/v1/order'
-        params = {
-            'symbol': symbol.upper(),
-            'side': side.upper(),
-            'type': 'LIMIT',
-            'timeInForce': timeInForce,
-            'quantity': quantity,
-            'price': price,
-            'reduceOnly': str(reduce_only).lower()
+    def _place_order(self, params):
+        try:
+            return self._signed_request('POST', '/fapi/v1/order', params, orders=1,
+                                        reconcile=lambda: self._find_order(params))
+        except BinanceAPIError as e:
+            if e.code != DUPLICATE_CLIENT_ORDER_ID:
+                raise
+            # An earlier attempt reached the exchange even though we never saw its response
+            return self._recover_duplicate(params)
+
+    def _recover_duplicate(self, params):
+        logger.warning(f"Order {params['newClientOrderId']} already placed, fetching it instead of resending")
+        self.recovered_duplicates += 1
+        return self.get_order(params['symbol'], client_order_id=params['newClientOrderId'])
+
+    def _find_order(self, params):
+        """Look up an order after an ambiguous failure; None means the exchange never received it."""
+        query = {'symbol': params['symbol'], 'origClientOrderId': params['newClientOrderId']}
+        try:
+            # -2013 is the expected answer when the order never arrived, so it is not logged as an error
+            order = self._signed_request('GET', '/fapi/v1/order', query, expected_codes=(ORDER_DOES_NOT_EXIST,))
+        except BinanceAPIError as e:
+            if e.code != ORDER_DOES_NOT_EXIST:
+                raise
+            return None
+        logger.warning(f"Order {params['newClientOrderId']} reached the exchange before the failure, not resending")
+        self.recovered_duplicates += 1
+        return order
+
+    def _symbol_filters(self, symbol: str):
+        """Filters for symbol, or None when validation is off or exchangeInfo can't be fetched."""
+        if self.filters is None:
+            return None
+        try:
+            return self.filters.get(symbol)
+        except OrderValidationError:
+            raise
+        except Exception as e:
+            logger.warning(f"Could not load trading filters, sending {symbol} orders unchecked: {e}")
+            return None
+
+    def _validate_order(self, symbol: str, order_type: str, quantity: float, price: float = None,
+                        reduce_only: bool = False):
+        filters = self._symbol_filters(symbol)
+        if filters is None:
+            return quantity, price
+        qty, prices, errors = validate_order_batch(
+            filters, [quantity], None if price is None else [price], market=order_type == 'MARKET',
+            reduce_only=reduce_only)
+        if errors[0] is not None:
+            logger.error(f"Rejected {order_type} order locally: {quantity} {symbol} | {errors[0]}")
+            raise OrderValidationError(f"Invalid {order_type} order for {symbol.upper()}: {errors[0]}")
+        return float(qty[0]), None if prices is None else float(prices[0])
+
+    def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False,
+                           client_order_id: str = None):
+        quantity, _ = self._validate_order(symbol, 'MARKET', quantity, reduce_only=reduce_only)
+        params = self._order_params(symbol, side, 'MARKET', quantity, reduce_only=reduce_only,
+                                    client_order_id=client_order_id)
+        logger.info(f"Placing MARKET order: {side} {quantity} {symbol} ({params['newClientOrderId']})")
+        return self._place_order(params)
+
+    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, timeInForce: str = 'GTC', reduce_only: bool = False,
+                          client_order_id: str = None):
+        quantity, price = self._validate_order(symbol, 'LIMIT', quantity, price, reduce_only)
+        params = self._order_params(symbol, side, 'LIMIT', quantity, price, timeInForce, reduce_only, client_order_id)
+        logger.info(f"Placing LIMIT order: {side} {quantity} {symbol} @ {price} ({params['newClientOrderId']})")
+        return self._place_order(params)
+
+    def _validate_batch(self, params_list):
+        """Snap and check params in place, grouped by symbol and type. Returns {index: error message}."""
+        groups = {}
+        for i, params in enumerate(params_list):
+            groups.setdefault((params['symbol'], params['type']), []).append(i)
+        errors = {}
+        for (symbol, order_type), indices in groups.items():
+            try:
+                filters = self._symbol_filters(symbol)
+            except OrderValidationError as e:
+                errors.update((i, str(e)) for i in indices)
+                continue
+            if filters is None:
+                continue
+            market = order_type == 'MARKET'
+            qty, prices, group_errors = validate_order_batch(
+                filters,
+                [params_list[i]['quantity'] for i in indices],
+                None if market else [params_list[i]['price'] for i in indices],
+                market=market,
+                reduce_only=[params_list[i]['reduceOnly'] == 'true' for i in indices])
+            for j, i in enumerate(indices):
+                if group_errors[j] is not None:
+                    errors[i] = group_errors[j]
+                    continue
+                params_list[i]['quantity'] = float(qty[j])
+                if not market:
+                    params_list[i]['price'] = float(prices[j])
+        return errors
+
+    def _prepare_batch(self, orders):
+        """Convert order dicts to exchange params, validate them and split them into batch-sized chunks.
+
+        Each order is a dict with keys: symbol, side, type ('MARKET' or 'LIMIT'),
+        quantity, and for LIMIT orders price and optionally timeInForce.
+        reduce_only and client_order_id are optional. Returns (results, chunks): results has an error
+        entry for every order rejected locally and None elsewhere; chunks is a list
+        of ([input indices], [params, ...]) still to be sent.
+        """
+        params_list = []
+        for order in orders:
+            params = self._order_params(
+                order['symbol'], order['side'], order.get('type', 'MARKET'), order['quantity'],
+                order.get('price'), order.get('timeInForce', 'GTC'), order.get('reduce_only', False),
+                order.get('client_order_id'))
+            if params['type'] not in ('MARKET', 'LIMIT'):
+                raise ValueError(f"Unsupported order type: {params['type']}")
+            if params['type'] == 'LIMIT' and params['price'] is None:
+                raise ValueError(f"LIMIT order for {params['symbol']} is missing a price")
+            params_list.append(params)
+        results = [None] * len(params_list)
+        for i, message in self._validate_batch(params_list).items():
+            params = params_list[i]
+            logger.error(f"Rejected {params['type']} order locally: {params['quantity']} {params['symbol']} | {message}")
+            results[i] = {'code': None, 'msg': message}
+        # The batch endpoint expects every value as a string
+        pending = [(i, {k: str(v) for k, v in params.items()})
+                   for i, params in enumerate(params_list) if results[i] is None]
+        chunks = []
+        for start in range(0, len(pending), MAX_BATCH_ORDERS):
+            part = pending[start:start + MAX_BATCH_ORDERS]
+            chunks.append(([i for i, _ in part], [params for _, params in part]))
+        return results, chunks
+
+    def _place_batch_chunk(self, chunk):
+        """Send one signed /fapi/v1/batchOrders request and return one result per order.
+
+        Orders the exchange rejects come back as {'code': ..., 'msg': ...}. If the whole
+        request fails, every order in the chunk gets an error entry instead of raising.
+        After an ambiguous failure only the orders the exchange reports missing are resent.
+        """
+        path = '/fapi/v1/batchOrders'
+        params = {'batchOrders': json.dumps(chunk, separators=(',', ':'))}
+        results = [None] * len(chunk)
+        pending = list(range(len(chunk)))
+
+        def reconcile():
+            for i in list(pending):
+                order = self._find_order(chunk[i])
+                if order is not None:
+                    results[i] = order
+                    pending.remove(i)
+            if not pending:
+                return []
+            # The next attempt signs a copy of params, so it only carries the missing orders
+            params['batchOrders'] = json.dumps([chunk[i] for i in pending], separators=(',', ':'))
+            return None
+
+        try:
+            sent = self._signed_request('POST', path, params, weight=5, orders=lambda: len(pending),
+                                        reconcile=reconcile)
+        except Exception as e:
+            logger.error(f"Batch of {len(pending)} orders failed: {e}")
+            sent = [{'code': None, 'msg': str(e)} for _ in pending]
+        if not isinstance(sent, list) or len(sent) != len(pending):
+            msg = f"Unexpected batch response: {sent}"
+            logger.error(msg)
+            sent = [{'code': None, 'msg': msg} for _ in pending]
+        for i, result in zip(pending, sent):
+            results[i] = result
+        for i in pending:
+            order, result = chunk[i], results[i]
+            if result.get('code') == DUPLICATE_CLIENT_ORDER_ID:
+                try:
+                    results[i] = self._recover_duplicate(order)
+                    continue
+                except Exception as e:
+                    result = {'code': None, 'msg': str(e)}
+                    results[i] = result
+            if 'code' in result and 'orderId' not in result:
+                logger.error(f"Batch order rejected: {order['side']} {order['quantity']} {order['symbol']} | "
+                             f"{result.get('code')} - {result.get('msg')}")
+        return results
+
+    def place_orders_batch(self, orders):
+        """Place many MARKET/LIMIT orders using as few batch requests as possible.
+
+        Returns a list with one entry per input order, in the same order: the order
+        response on success, or {'code': ..., 'msg': ...} if it was rejected, either
+        locally by the exchangeInfo filters (code None) or by the exchange.
+        """
+        orders = list(orders)
+        logger.info(f"Placing {len(orders)} orders in batches of up to {MAX_BATCH_ORDERS}")
+        results, chunks = self._prepare_batch(orders)
+        for indices, chunk in chunks:
+            for i, result in zip(indices, self._place_batch_chunk(chunk)):
+                results[i] = result
+        return results
+
+    def rate_limit_stats(self):
+        return self.rate_limiter.stats()
+
+    def health(self):
+        """Retry, circuit breaker and rate limiter counters for monitoring."""
+        return {
+            'retries': self.retries,
+            'recovered_duplicates': self.recovered_duplicates,
+            'circuit': self.circuit.stats(),
+            'rate_limiter': self.rate_limiter.stats(),
         }
-        logger.info(f"Placing LIMIT order: {side} {quantity} {symbol} @ {price}")
-        return self._signed_request('POST', path, params)
+
+    def close(self):
+        self.clock.stop()
+        self.session.close()
+
+
+# ---------- Streaming ----------
+class OrderBook:
+    """Local L2 book kept in sorted price arrays.
+
+    Bids and asks are both stored in ascending price order, so the best bid is the
+    last element and the best ask the first: top-of-book reads are O(1) and each
+    level update is a binary search plus a list insert/delete.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol.upper()
+        self.bid_prices, self.bid_qtys = [], []
+        self.ask_prices, self.ask_qtys = [], []
+        self.last_update_id = None
+        self.synced = False
+        self.event_time = None
+
+    def load_snapshot(self, snapshot):
+        bids = sorted((float(p), float(q)) for p, q in snapshot['bids'])
+        asks = sorted((float(p), float(q)) for p, q in snapshot['asks'])
+        self.bid_prices, self.bid_qtys = [p for p, _ in bids], [q for _, q in bids]
+        self.ask_prices, self.ask_qtys = [p for p, _ in asks], [q for _, q in asks]
+        self.last_update_id = snapshot['lastUpdateId']
+
+    @staticmethod
+    def _set_level(prices, qtys, price, qty):
+        i = bisect_left(prices, price)
+        if i < len(prices) and prices[i] == price:
+            if qty == 0:
+                del prices[i]
+                del qtys[i]
+            else:
+                qtys[i] = qty
+        elif qty != 0:
+            prices.insert(i, price)
+            qtys.insert(i, qty)
+
+    def apply_diff(self, event):
+        for p, q in event['b']:
+            self._set_level(self.bid_prices, self.bid_qtys, float(p), float(q))
+        for p, q in event['a']:
+            self._set_level(self.ask_prices, self.ask_qtys, float(p), float(q))
+        self.last_update_id = event['u']
+        self.event_time = event.get('E')
+
+    def best_bid(self):
+        return (self.bid_prices[-1], self.bid_qtys[-1]) if self.bid_prices else None
+
+    def best_ask(self):
+        return (self.ask_prices[0], self.ask_qtys[0]) if self.ask_prices else None
+
+    def mid_price(self):
+        bid, ask = self.best_bid(), self.best_ask()
+        return (bid[0] + ask[0]) / 2 if bid and ask else None
+
+    def top(self, levels: int = 5):
+        """Return ([(price, qty), ...] bids best-first, [(price, qty), ...] asks best-first)."""
+        bids = list(zip(reversed(self.bid_prices[-levels:]), reversed(self.bid_qtys[-levels:])))
+        asks = list(zip(self.ask_prices[:levels], self.ask_qtys[:levels]))
+        return bids, asks
+
+
+class AccountCache:
+    """Balances and positions from the user-data stream, keyed for O(1) lookups.
+
+    Updated from the stream thread; iterate over balances_snapshot() from other threads.
+    """
+
+    def __init__(self):
+        self.balances = {}
+        self.positions = {}
+        self.orders = {}
+        self.synced = False
+        self.event_time = None
+        self._lock = threading.Lock()
+
+    def load_balances(self, balances):
+        with self._lock:
+            for b in balances:
+                self.balances[b['asset']] = {
+                    'balance': float(b['balance']),
+                    'crossWalletBalance': float(b.get('crossWalletBalance', b['balance'])),
+                    'availableBalance': float(b.get('availableBalance', b['balance'])),
+                }
+
+    def apply_event(self, event):
+        kind = event.get('e')
+        self.event_time = event.get('E')
+        if kind == 'ACCOUNT_UPDATE':
+            with self._lock:
+                for b in event['a'].get('B', []):
+                    entry = self.balances.setdefault(b['a'], {})
+                    entry['balance'] = float(b['wb'])
+                    entry['crossWalletBalance'] = float(b['cw'])
+                for p in event['a'].get('P', []):
+                    self.positions[(p['s'], p.get('ps', 'BOTH'))] = {
+                        'positionAmt': float(p['pa']),
+                        'entryPrice': float(p['ep']),
+                        'unrealizedProfit': float(p['up']),
+                    }
+        elif kind == 'ORDER_TRADE_UPDATE':
+            order = event['o']
+            self.orders[order['i']] = order
+
+    def balances_snapshot(self):
+        """Copy of every balance, safe to iterate while the stream keeps updating."""
+        with self._lock:
+            return {asset: dict(b) for asset, b in self.balances.items()}
+
+    def balance(self, asset: str):
+        return self.balances.get(asset.upper())
+
+    def position(self, symbol: str, side: str = 'BOTH'):
+        return self.positions.get((symbol.upper(), side))
+
+
+class _ResyncNeeded(Exception):
+    pass
+
+
+class _WebSocketStream:
+    """Runs one WebSocket connection on its own event loop thread and reconnects with backoff.
+
+    Subclasses implement _stream_url() and _consume(ws); _consume re-seeds any local
+    state from REST, so every reconnect starts from a fresh snapshot.
+    """
+
+    name = 'stream'
+
+    def __init__(self, bot: 'BasicBot', ws_base: str = DEFAULT_TESTNET_WS):
+        if websockets is None:
+            raise RuntimeError("The 'websockets' package is required for streaming (pip install websockets)")
+        self.bot = bot
+        self.ws_base = ws_base.rstrip('/')
+        self.reconnects = 0
+        self._loop = None
+        self._task = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._thread_main, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._task is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _thread_main(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._task = self._loop.create_task(self._run_forever())
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    async def _rest(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _run_forever(self):
+        delay = 1
+        while True:
+            try:
+                async with websockets.connect(await self._stream_url()) as ws:
+                    logger.info(f"{self.name} connected")
+                    delay = 1
+                    await self._consume(ws)
+            except asyncio.CancelledError:
+                raise
+            except _ResyncNeeded as e:
+                logger.warning(f"{self.name} out of sync ({e}), resyncing")
+            except Exception as e:
+                logger.warning(f"{self.name} disconnected: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+            self._on_disconnect()
+            self.reconnects += 1
+
+    def _on_disconnect(self):
+        pass
+
+    async def _stream_url(self):
+        raise NotImplementedError
+
+    async def _consume(self, ws):
+        raise NotImplementedError
+
+
+class DepthStream(_WebSocketStream):
+    """Maintains an OrderBook from a REST snapshot plus the <symbol>@depth diff stream."""
+
+    name = 'DepthStream'
+
+    def __init__(self, bot, symbol: str, ws_base: str = DEFAULT_TESTNET_WS, speed: str = '100ms',
+                 snapshot_limit: int = DEPTH_SNAPSHOT_LIMIT):
+        super().__init__(bot, ws_base)
+        self.book = OrderBook(symbol)
+        self.speed = speed
+        self.snapshot_limit = snapshot_limit
+
+    async def _stream_url(self):
+        return f"{self.ws_base}/ws/{self.book.symbol.lower()}@depth@{self.speed}"
+
+    def _on_disconnect(self):
+        self.book.synced = False
+
+    async def _consume(self, ws):
+        # Wait for the first diff so the stream is buffering before we take the snapshot
+        event = json.loads(await ws.recv())
+        snapshot = await self._rest(self.bot.get_depth_snapshot, self.book.symbol, self.snapshot_limit)
+        self.book.load_snapshot(snapshot)
+        prev_u = None
+        while True:
+            if prev_u is None:
+                if event['u'] < self.book.last_update_id:
+                    pass  # Already contained in the snapshot
+                elif event['U'] > self.book.last_update_id:
+                    raise _ResyncNeeded(f"gap between snapshot {self.book.last_update_id} and diff {event['U']}")
+                else:
+                    self.book.apply_diff(event)
+                    self.book.synced = True
+                    prev_u = event['u']
+            else:
+                if event['pu'] != prev_u:
+                    raise _ResyncNeeded(f"expected pu={prev_u}, got {event['pu']}")
+                self.book.apply_diff(event)
+                prev_u = event['u']
+            event = json.loads(await ws.recv())
+
+
+class UserDataStream(_WebSocketStream):
+    """Maintains an AccountCache from a REST balance snapshot plus the user-data stream."""
+
+    name = 'UserDataStream'
+
+    def __init__(self, bot, ws_base: str = DEFAULT_TESTNET_WS, keepalive: float = LISTEN_KEY_KEEPALIVE):
+        super().__init__(bot, ws_base)
+        self.account = AccountCache()
+        self.keepalive = keepalive
+
+    async def _stream_url(self):
+        listen_key = await self._rest(self.bot.create_listen_key)
+        return f"{self.ws_base}/ws/{listen_key}"
+
+    def _on_disconnect(self):
+        self.account.synced = False
+
+    async def _keepalive_loop(self):
+        while True:
+            await asyncio.sleep(self.keepalive)
+            try:
+                await self._rest(self.bot.keepalive_listen_key)
+            except Exception as e:
+                logger.warning(f"listenKey keepalive failed: {e}")
+
+    async def _consume(self, ws):
+        self.account.load_balances(await self._rest(self.bot.get_account_balance))
+        self.account.synced = True
+        keepalive = asyncio.create_task(self._keepalive_loop())
+        try:
+            async for message in ws:
+                event = json.loads(message)
+                if event.get('e') == 'listenKeyExpired':
+                    raise _ResyncNeeded('listenKey expired')
+                self.account.apply_event(event)
+        finally:
+            keepalive.cancel()
+
+
+# ---------- AsyncBasicBot Class ----------
+class AsyncBasicBot:
+    """asyncio front-end for BasicBot.
+
+    Each call runs the blocking BasicBot request on a worker thread, so up to
+    `concurrency` orders are in flight at once over the shared connection pool.
+
+    Usage:
+        async with AsyncBasicBot(key, secret, concurrency=20) as bot:
+            results = await asyncio.gather(*(bot.place_limit_order(...) for ... in basket))
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = DEFAULT_TESTNET_BASE, recv_window: int = 5000,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        self.concurrency = concurrency
+        self.bot = BasicBot(api_key, api_secret, base_url=base_url, recv_window=recv_window, pool_size=concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='AsyncBasicBot')
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _run(self, func, *args, **kwargs):
+        # The semaphore is created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    async def get_account_balance(self):
+        return await self._run(self.bot.get_account_balance)
+
+    async def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False,
+                                 client_order_id: str = None):
+        return await self._run(self.bot.place_market_order, symbol, side, quantity, reduce_only=reduce_only,
+                               client_order_id=client_order_id)
+
+    async def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, timeInForce: str = 'GTC', reduce_only: bool = False,
+                                client_order_id: str = None):
+        return await self._run(self.bot.place_limit_order, symbol, side, quantity, price,
+                               timeInForce=timeInForce, reduce_only=reduce_only, client_order_id=client_order_id)
+
+    async def place_orders_batch(self, orders):
+        """Like BasicBot.place_orders_batch, but sends the batch chunks concurrently."""
+        orders = list(orders)
+        logger.info(f"Placing {len(orders)} orders in batches of up to {MAX_BATCH_ORDERS}")
+        results, chunks = await self._run(self.bot._prepare_batch, orders)
+        chunk_results = await asyncio.gather(*(self._run(self.bot._place_batch_chunk, chunk) for _, chunk in chunks))
+        for (indices, _), chunk_result in zip(chunks, chunk_results):
+            for i, result in zip(indices, chunk_result):
+                results[i] = result
+        return results
+
+    def rate_limit_stats(self):
+        return self.bot.rate_limit_stats()
+
+    def health(self):
+        return self.bot.health()
+
+    async def close(self):
+        self._executor.shutdown(wait=True)
+        self.bot.close()
+
+
+# ---------- Headless Batch Mode ----------
+ORDER_FIELDS = ('symbol', 'side', 'type', 'quantity', 'price', 'timeInForce', 'reduce_only', 'client_order_id')
+
+
+def _parse_order(raw: dict) -> dict:
+    """Normalize one order row (CSV strings or JSON values) to place_* arguments."""
+    order = {k: v for k, v in raw.items() if k in ORDER_FIELDS and v not in (None, '')}
+    missing = [k for k in ('symbol', 'side', 'quantity') if k not in order]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    order['type'] = str(order.get('type', 'LIMIT' if 'price' in order else 'MARKET')).upper()
+    order['quantity'] = float(order['quantity'])
+    if 'price' in order:
+        order['price'] = float(order['price'])
+    if 'reduce_only' in order:
+        order['reduce_only'] = str(order['reduce_only']).lower() in ('1', 'true', 'yes')
+    return order
+
+
+def read_orders(stream, fmt: str):
+    """Yield (index, order or None, error or None) for each order in a CSV or JSON-lines stream."""
+    if fmt == 'csv':
+        rows = csv.DictReader(stream)
+    else:
+        rows = (line for line in stream if line.strip())
+    for index, row in enumerate(rows):
+        try:
+            if fmt != 'csv':
+                row = json.loads(row)
+            yield index, _parse_order(row), None
+        except (ValueError, TypeError, AttributeError) as e:
+            yield index, row, f"invalid order: {e}"
+
+
+async def _submit(bot: AsyncBasicBot, order: dict):
+    options = {'reduce_only': order.get('reduce_only', False), 'client_order_id': order.get('client_order_id')}
+    if order['type'] == 'MARKET':
+        return await bot.place_market_order(order['symbol'], order['side'], order['quantity'], **options)
+    if order['type'] == 'LIMIT':
+        if 'price' not in order:
+            raise ValueError("LIMIT order is missing a price")
+        return await bot.place_limit_order(order['symbol'], order['side'], order['quantity'], order['price'],
+                                           timeInForce=order.get('timeInForce', 'GTC'), **options)
+    raise ValueError(f"Unsupported order type: {order['type']}")
+
+
+async def run_batch(bot: AsyncBasicBot, orders, out, concurrency: int):
+    """Stream orders through the bot with `concurrency` workers, writing one JSON line per result as it completes."""
+    work = asyncio.Queue(maxsize=concurrency * 2)
+    loop = asyncio.get_running_loop()
+    latencies = []
+    counts = {'ok': 0, 'failed': 0}
+
+    def write(record):
+        out.write(json.dumps(record, default=str) + '\n')
+        out.flush()
+
+    async def produce():
+        iterator = iter(orders)
+        while True:
+            # Reading runs off the event loop so a slow stdin doesn't stall in-flight orders
+            item = await loop.run_in_executor(None, next, iterator, None)
+            if item is None:
+                break
+            await work.put(item)
+        for _ in range(concurrency):
+            await work.put(None)
+
+    async def worker():
+        while (item := await work.get()) is not None:
+            index, order, error = item
+            record = {'index': index, 'order': order}
+            started = time.perf_counter()
+            if error is None:
+                try:
+                    record['result'] = await _submit(bot, order)
+                except Exception as e:
+                    error = str(e)
+            elapsed = time.perf_counter() - started
+            record['ok'] = error is None
+            if error is None:
+                latencies.append(elapsed)
+                counts['ok'] += 1
+            else:
+                record['error'] = error
+                counts['failed'] += 1
+            record['latency_ms'] = round(elapsed * 1000, 3)
+            write(record)
+
+    started = time.perf_counter()
+    await asyncio.gather(produce(), *(worker() for _ in range(concurrency)))
+    return summarize(latencies, counts, time.perf_counter() - started)
+
+
+def summarize(latencies, counts, elapsed):
+    total = counts['ok'] + counts['failed']
+    summary = {
+        'orders': total,
+        'ok': counts['ok'],
+        'failed': counts['failed'],
+        'elapsed_s': round(elapsed, 3),
+        'orders_per_s': round(total / elapsed, 2) if elapsed > 0 else None,
+    }
+    if latencies:
+        ms = np.asarray(latencies) * 1000
+        summary.update({
+            'latency_p50_ms': round(float(np.percentile(ms, 50)), 3),
+            'latency_p99_ms': round(float(np.percentile(ms, 99)), 3),
+            'latency_max_ms': round(float(ms.max()), 3),
+        })
+    return summary
+
+
+def run_headless(args):
+    api_key = args.api_key or os.getenv('BINANCE_API_KEY')
+    api_secret = args.api_secret or os.getenv('BINANCE_API_SECRET')
+    if not api_key or not api_secret:
+        sys.exit("Set BINANCE_API_KEY and BINANCE_API_SECRET (or pass --api-key / --api-secret)")
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'csv' if args.orders.lower().endswith('.csv') else 'jsonl'
+    source = sys.stdin if args.orders == '-' else open(args.orders, newline='', encoding='utf-8')
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    async def go():
+        # The bot starts its clock sync on the first order and stops it on close
+        async with AsyncBasicBot(api_key, api_secret, base_url=args.base_url, concurrency=args.concurrency) as bot:
+            return await run_batch(bot, read_orders(source, fmt), out, args.concurrency)
+
+    try:
+        summary = asyncio.run(go())
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Binance Futures Testnet trading bot")
+    parser.add_argument('--orders', help="run headless: CSV or JSON-lines order file, '-' for stdin")
+    parser.add_argument('--format', choices=['auto', 'csv', 'jsonl'], default='auto',
+                        help="order file format (default: from the file extension, jsonl for stdin)")
+    parser.add_argument('--output', default='-', help="JSON-lines results file (default: stdout)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="orders in flight at once")
+    parser.add_argument('--base-url', default=DEFAULT_TESTNET_BASE)
+    parser.add_argument('--api-key')
+    parser.add_argument('--api-secret')
+    return parser.parse_args(argv)
 
 
 # ---------- CLI Menu ----------
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.orders:
+        run_headless(args)
+        return
+
     print("=== Binance Futures Testnet Trading Bot ===")
     api_key = input("Enter your API Key: ").strip()
     api_secret = input("Enter your API Secret: ").strip()
 
-    bot = BasicBot(api_key, api_secret)
+    bot = BasicBot(api_key, api_secret, base_url=args.base_url)
+    bot.clock.start()
+
+    # Balances are served from the user-data stream when it's available; depth streams start on demand
+    user_stream = UserDataStream(bot).start() if websockets is not None else None
+    depth_streams = {}
 
     while True:
         print("\nChoose an option:")
         print("1. Check Balance")
         print("2. Place Market Order")
         print("3. Place Limit Order")
-        print("4. Exit")
+        print("4. Show Order Book")
+        print("5. Exit")
 
-        choice = input("Enter choice (1-4): ").strip()
+        choice = input("Enter choice (1-5): ").strip()
 
         try:
             if choice == "1":
-                bal = bot.get_account_balance()
-                print("Account Balance:")
-                for b in bal:
-                    print(f"Asset: {b['asset']}, Balance: {b['balance']}, Available: {b['availableBalance']}")
+                if user_stream is not None and user_stream.account.synced:
+                    print("Account Balance (live stream):")
+                    for asset, b in user_stream.account.balances_snapshot().items():
+                        print(f"Asset: {asset}, Balance: {b['balance']}, Cross Wallet: {b['crossWalletBalance']}")
+                else:
+                    bal = bot.get_account_balance()
+                    print("Account Balance:")
+                    for b in bal:
+                        print(f"Asset: {b['asset']}, Balance: {b['balance']}, Available: {b['availableBalance']}")
             elif choice == "2":
                 symbol = input("Symbol (e.g. BTCUSDT): ").upper()
                 side = input("Side (BUY/SELL): ").upper()
@@ -173,10 +1667,28 @@ def main():
                 res = bot.place_limit_order(symbol, side, qty, price)
                 print("Limit Order Response:", res)
             elif choice == "4":
+                if websockets is None:
+                    print("Order book streaming needs the 'websockets' package (pip install websockets)")
+                    continue
+                symbol = input("Symbol (e.g. BTCUSDT): ").upper()
+                if symbol not in depth_streams:
+                    depth_streams[symbol] = DepthStream(bot, symbol).start()
+                    print(f"Started {symbol} depth stream, syncing order book...")
+                book = depth_streams[symbol].book
+                if not book.synced:
+                    print("Order book not synced yet, try again in a moment.")
+                    continue
+                bids, asks = book.top(5)
+                print(f"{symbol} order book (update {book.last_update_id}):")
+                for price, qty in reversed(asks):
+                    print(f"  ASK {price:>14} {qty:>12}")
+                for price, qty in bids:
+                    print(f"  BID {price:>14} {qty:>12}")
+            elif choice == "5":
                 print("Exiting bot. Goodbye!")
                 sys.exit(0)
             else:
-                print("Invalid choice. Please select 1-4.")
+                print("Invalid choice. Please select 1-5.")
         except Exception as e:
             logger.exception(f"Error during operation: {e}")
             print(f"⚠️ Error: {e}")
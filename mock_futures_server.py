@@ -0,0 +1,450 @@
+"""
+Local stand-in for the Binance Futures (USDT-M) REST API
+
+Implements just enough of the testnet surface used by intern.py to exercise
+BasicBot / AsyncBasicBot without touching the network:
+- POST /fapi/v1/order        (MARKET and LIMIT orders, duplicate newClientOrderId rejected)
+- GET  /fapi/v1/order        (lookup by orderId or origClientOrderId)
+- POST /fapi/v1/batchOrders  (up to 5 orders per request)
+- GET  /fapi/v2/balance
+- GET  /fapi/v1/time         (optionally skewed from the local clock)
+- GET  /fapi/v1/depth        (snapshots set through `depth_snapshots`)
+- GET  /fapi/v1/exchangeInfo (trading filters set through `symbols`)
+- POST/PUT /fapi/v1/listenKey
+
+Signed requests are checked for a valid HMAC-SHA256 signature when a secret is given.
+
+For load testing the server can add latency (fixed + random jitter), inject
+errors (503 responses or dropped connections), and enforce request-weight and
+order-count limits per fixed window, answering with 429 + Retry-After and the
+X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-* headers like the real exchange.
+
+MockStreamServer replays scripted WebSocket messages (depth diffs, user-data
+events) per stream path, for testing DepthStream / UserDataStream. It needs the
+'websockets' package.
+
+Usage:
+    python mock_futures_server.py            # serves on http://127.0.0.1:8765
+    python mock_futures_server.py --latency-ms 20 --jitter-ms 10 --error-rate 0.01 --weight-limit 2400
+
+    # or from Python
+    with MockFuturesServer(api_secret="secret") as server:
+        bot = BasicBot("key", "secret", base_url=server.base_url)
+"""
+
+import hmac
+import hashlib
+import json
+import itertools
+import threading
+import time
+import asyncio
+import random
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BATCH_ORDERS = 5
+
+# Request weight per endpoint; anything not listed weighs 1
+ENDPOINT_WEIGHTS = {
+    '/fapi/v1/batchOrders': 5,
+    '/fapi/v2/balance': 5,
+    '/fapi/v1/depth': 20,
+}
+
+
+def mock_symbol_filters(tick_size: str, step_size: str, min_notional: str):
+    """exchangeInfo filter list in the exchange's format."""
+    return [
+        {'filterType': 'PRICE_FILTER', 'minPrice': tick_size, 'maxPrice': '1000000', 'tickSize': tick_size},
+        {'filterType': 'LOT_SIZE', 'minQty': step_size, 'maxQty': '1000', 'stepSize': step_size},
+        {'filterType': 'MARKET_LOT_SIZE', 'minQty': step_size, 'maxQty': '120', 'stepSize': step_size},
+        {'filterType': 'MIN_NOTIONAL', 'notional': min_notional},
+    ]
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise Nagle + delayed ACK adds ~40ms per keep-alive request
+    disable_nagle_algorithm = True
+
+    # Silence the default per-request stderr logging
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_params(self):
+        parts = urlsplit(self.path)
+        query = parts.query
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            body = self.rfile.read(length).decode('utf-8')
+            query = f"{query}&{body}" if query else body
+        return parts.path, query
+
+    def _check_signature(self, query):
+        secret = self.server.exchange.api_secret
+        if secret is None:
+            return True
+        payload, sep, signature = query.rpartition('&signature=')
+        if not sep:
+            return False
+        expected = hmac.new(secret.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def _dispatch(self, method):
+        exchange = self.server.exchange
+        path, query = self._read_params()
+        route = exchange.routes.get((method, path))
+        if route is None:
+            self._send_json(404, {'code': -1000, 'msg': f'Unknown endpoint {method} {path}'})
+            return
+        if path not in exchange.public_paths and not self._check_signature(query):
+            self._send_json(400, {'code': -1022, 'msg': 'Signature for this request is not valid.'})
+            return
+        params = dict(parse_qsl(query))
+        exchange.simulate_latency()
+        fault = exchange.inject_fault()
+        if fault == 'drop':
+            # Close without answering, as a reset connection would look to the client
+            self.close_connection = True
+            return
+        if fault == 'error':
+            self._send_json(503, {'code': -1001, 'msg': 'Internal error; unable to process your request. Please try again.'})
+            return
+        allowed, headers = exchange.consume_limits(method, path, params)
+        if not allowed:
+            self._send_json(429, {'code': -1003, 'msg': 'Too many requests; please use the websocket for live updates.'},
+                            headers)
+            return
+        status, payload = route(params)
+        self._send_json(status, payload, headers)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class MockFuturesServer:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = 0, api_secret: str = None, clock_skew_ms: int = 0,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0, drop_rate: float = 0.0,
+                 weight_limit: int = None, order_limit_10s: int = None, order_limit_1m: int = None):
+        self.api_secret = api_secret
+        self.clock_skew_ms = clock_skew_ms
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.limits = {
+            ('weight', 60): weight_limit,
+            ('orders', 10): order_limit_10s,
+            ('orders', 60): order_limit_1m,
+        }
+        self._usage = {}
+        self.requests = 0
+        self.rejected = 0
+        self.faults = 0
+        self.orders = []
+        self.balances = [
+            {'accountAlias': 'mock', 'asset': 'USDT', 'balance': '10000.00000000',
+             'availableBalance': '10000.00000000', 'crossWalletBalance': '10000.00000000'},
+        ]
+        self.routes = {
+            ('POST', '/fapi/v1/order'): self._new_order,
+            ('GET', '/fapi/v1/order'): self._query_order,
+            ('POST', '/fapi/v1/batchOrders'): self._batch_orders,
+            ('GET', '/fapi/v2/balance'): self._balance,
+            ('GET', '/fapi/v1/time'): self._server_time,
+            ('GET', '/fapi/v1/depth'): self._depth,
+            ('GET', '/fapi/v1/exchangeInfo'): self._exchange_info,
+            ('POST', '/fapi/v1/listenKey'): self._listen_key,
+            ('PUT', '/fapi/v1/listenKey'): self._listen_key,
+        }
+        self.public_paths = {'/fapi/v1/time', '/fapi/v1/depth', '/fapi/v1/exchangeInfo', '/fapi/v1/listenKey'}
+        self.symbols = {'BTCUSDT': mock_symbol_filters('0.10', '0.001', '100')}
+        self.depth_snapshots = {}
+        self.listen_key = 'mock-listen-key'
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _MockHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.exchange = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ---------- Simulation ----------
+    def simulate_latency(self):
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def inject_fault(self):
+        roll = random.random()
+        if roll < self.drop_rate:
+            fault = 'drop'
+        elif roll < self.drop_rate + self.error_rate:
+            fault = 'error'
+        else:
+            return None
+        with self._lock:
+            self.faults += 1
+        return fault
+
+    def consume_limits(self, method, path, params):
+        """Count the request against the fixed-window limits. Returns (allowed, response headers)."""
+        weight = ENDPOINT_WEIGHTS.get(path, 1)
+        orders = 0
+        if method == 'POST' and path == '/fapi/v1/order':
+            orders = 1
+        elif method == 'POST' and path == '/fapi/v1/batchOrders':
+            try:
+                orders = len(json.loads(params.get('batchOrders', '[]')))
+            except ValueError:
+                orders = 0
+        now = time.time()
+        with self._lock:
+            self.requests += 1
+            usage = {}
+            for (kind, interval), limit in self.limits.items():
+                window = int(now // interval)
+                start, used = self._usage.get((kind, interval), (window, 0))
+                usage[(kind, interval)] = (used if start == window else 0), window
+            retry_after = 0
+            for (kind, interval), (used, window) in usage.items():
+                limit = self.limits[(kind, interval)]
+                cost = weight if kind == 'weight' else orders
+                if limit is not None and cost and used + cost > limit:
+                    retry_after = max(retry_after, (window + 1) * interval - now)
+            allowed = retry_after == 0
+            if allowed:
+                for (kind, interval), (used, window) in usage.items():
+                    cost = weight if kind == 'weight' else orders
+                    usage[(kind, interval)] = used + cost, window
+            else:
+                self.rejected += 1
+            for key, (used, window) in usage.items():
+                self._usage[key] = (window, used)
+        headers = {
+            'X-MBX-USED-WEIGHT-1M': usage[('weight', 60)][0],
+            'X-MBX-ORDER-COUNT-10S': usage[('orders', 10)][0],
+            'X-MBX-ORDER-COUNT-1M': usage[('orders', 60)][0],
+        }
+        if not allowed:
+            headers['Retry-After'] = max(1, int(retry_after + 0.999))
+        return allowed, headers
+
+    def stats(self):
+        with self._lock:
+            return {'requests': self.requests, 'rate_limited': self.rejected, 'faults': self.faults,
+                    'orders': len(self.orders)}
+
+    # ---------- Endpoints ----------
+    def _new_order(self, params):
+        order_type = params.get('type')
+        if order_type not in ('MARKET', 'LIMIT'):
+            return 400, {'code': -1116, 'msg': 'Invalid orderType.'}
+        if order_type == 'LIMIT' and 'price' not in params:
+            return 400, {'code': -1102, 'msg': "Mandatory parameter 'price' was not sent."}
+        with self._lock:
+            client_order_id = params.get('newClientOrderId')
+            if client_order_id and any(o['clientOrderId'] == client_order_id for o in self.orders):
+                return 400, {'code': -4116, 'msg': 'ClientOrderId is duplicated.'}
+            order_id = next(self._order_ids)
+            order = {
+                'orderId': order_id,
+                'symbol': params.get('symbol'),
+                'status': 'FILLED' if order_type == 'MARKET' else 'NEW',
+                'clientOrderId': client_order_id or f'mock-{order_id}',
+                'price': params.get('price', '0'),
+                'origQty': params.get('quantity'),
+                'side': params.get('side'),
+                'type': order_type,
+                'timeInForce': params.get('timeInForce', 'GTC'),
+                'reduceOnly': params.get('reduceOnly') == 'true',
+                'updateTime': int(time.time() * 1000),
+            }
+            self.orders.append(order)
+        return 200, order
+
+    def _query_order(self, params):
+        with self._lock:
+            for order in self.orders:
+                if (str(order['orderId']) == params.get('orderId')
+                        or order['clientOrderId'] == params.get('origClientOrderId')):
+                    return 200, order
+        return 400, {'code': -2013, 'msg': 'Order does not exist.'}
+
+    def _batch_orders(self, params):
+        try:
+            batch = json.loads(params.get('batchOrders', ''))
+        except ValueError:
+            batch = None
+        if not isinstance(batch, list) or not 0 < len(batch) <= MAX_BATCH_ORDERS:
+            return 400, {'code': -1130, 'msg': "Data sent for parameter 'batchOrders' is not valid."}
+        # Each order succeeds or fails on its own, like the real endpoint
+        return 200, [self._new_order(order)[1] for order in batch]
+
+    def _balance(self, params):
+        return 200, self.balances
+
+    def _server_time(self, params):
+        return 200, {'serverTime': int(time.time() * 1000) + self.clock_skew_ms}
+
+    def _depth(self, params):
+        snapshot = self.depth_snapshots.get(params.get('symbol'))
+        if snapshot is None:
+            return 400, {'code': -1121, 'msg': 'Invalid symbol.'}
+        return 200, snapshot
+
+    def _exchange_info(self, params):
+        return 200, {
+            'timezone': 'UTC',
+            'serverTime': int(time.time() * 1000) + self.clock_skew_ms,
+            'symbols': [{'symbol': symbol, 'status': 'TRADING', 'filters': filters}
+                        for symbol, filters in self.symbols.items()],
+        }
+
+    def _listen_key(self, params):
+        return 200, {'listenKey': self.listen_key}
+
+
+class MockStreamServer:
+    """WebSocket server that replays scripted messages on each connection.
+
+    `scripts` maps a stream path (e.g. '/ws/btcusdt@depth@100ms') to a list of
+    connections; each connection is a list of JSON-serializable messages. After the
+    last message the connection is closed unless it is the final scripted one,
+    which stays open so clients can be inspected in a steady state.
+    """
+
+    def __init__(self, scripts, host: str = DEFAULT_HOST, port: int = 0, interval: float = 0.0):
+        if websockets is None:
+            raise RuntimeError("The 'websockets' package is required for MockStreamServer")
+        self.scripts = {path: list(connections) for path, connections in scripts.items()}
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.connections = 0
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = None
+
+    @property
+    def ws_base(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def _handler(self, ws):
+        self.connections += 1
+        connections = self.scripts.get(ws.request.path)
+        if not connections:
+            await ws.close()
+            return
+        last = len(connections) == 1
+        messages = connections[0] if last else connections.pop(0)
+        for message in messages:
+            await ws.send(json.dumps(message))
+            if self.interval:
+                await asyncio.sleep(self.interval)
+        if last:
+            await ws.wait_closed()
+
+    async def _serve(self):
+        self._server = await websockets.serve(self._handler, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        await self._server.wait_closed()
+
+    def start(self):
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._serve())
+            self._loop.close()
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local mock of the Binance Futures REST API")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--api-secret', help="verify request signatures with this secret")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="fixed delay added to every request")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="extra uniform random delay up to this value")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="fraction of connections closed without a reply")
+    parser.add_argument('--weight-limit', type=int, help="request weight allowed per minute")
+    parser.add_argument('--order-limit-10s', type=int, help="orders allowed per 10 seconds")
+    parser.add_argument('--order-limit-1m', type=int, help="orders allowed per minute")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    server = MockFuturesServer(args.host, args.port, args.api_secret, latency_ms=args.latency_ms,
+                               jitter_ms=args.jitter_ms, error_rate=args.error_rate, drop_rate=args.drop_rate,
+                               weight_limit=args.weight_limit, order_limit_10s=args.order_limit_10s,
+                               order_limit_1m=args.order_limit_1m)
+    print(f"Mock Binance Futures API listening on {server.base_url} (Ctrl+C to stop)", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server._httpd.server_close()